@@ -0,0 +1,141 @@
+"""
+Mixed read/write concurrency benchmark for the SQLite tuning profile.
+
+Runs reader threads paging through GET /articles-style queries alongside
+writer threads doing /store-style single-row commits, once against SQLite's
+defaults (rollback journal, synchronous=FULL) and once with the profile from
+models.database.sqlite_pragmas(), each on its own fresh database file.
+
+Usage (from the project directory):
+    python -m benchmarks.db_concurrency
+    python -m benchmarks.db_concurrency --readers 16 --writers 4 --seconds 10 --rows 200000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import create_engine, desc, insert, select
+from sqlalchemy.exc import OperationalError
+
+from models.article import Article
+from models.database import Base, apply_sqlite_pragmas, sqlite_pragmas
+
+def _percentile(ordered: List[float], p: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+def build_engine(path: str, pragmas: Dict[str, str], pool_size: int):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False},
+                           pool_size=pool_size, max_overflow=0)
+    apply_sqlite_pragmas(engine, pragmas)
+    Base.metadata.create_all(engine)
+    return engine
+
+def seed(engine, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Article), [
+            {"title": f"Seed {i}", "summary": "Seed summary. " * 8, "category": "technology",
+             "source_url": f"https://seed.example.com/{i}", "timestamp": start + timedelta(seconds=i)}
+            for i in range(rows)
+        ])
+
+def run(engine, readers: int, writers: int, seconds: float) -> Dict:
+    stop = threading.Event()
+    lock = threading.Lock()
+    read_latencies: List[float] = []
+    write_latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    page = select(Article).order_by(desc(Article.timestamp), desc(Article.id)).limit(50)
+
+    def record(bucket: List[float], started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with lock:
+            bucket.append(elapsed)
+
+    def fail(e: Exception) -> None:
+        key = str(e.orig) if isinstance(e, OperationalError) else type(e).__name__
+        with lock:
+            errors[key] = errors.get(key, 0) + 1
+
+    def reader() -> None:
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(page).fetchall()
+                record(read_latencies, started)
+            except Exception as e:
+                fail(e)
+
+    def writer(n: int) -> None:
+        rng = random.Random(n)
+        i = 0
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(Article).values(
+                        title=f"Writer {n} article {i}", summary="Body. " * 40, category="technology",
+                        source_url=f"https://w{n}.example.com/{i}-{rng.random()}", timestamp=datetime.utcnow()
+                    ))
+                record(write_latencies, started)
+            except Exception as e:
+                fail(e)
+            i += 1
+
+    threads = ([threading.Thread(target=reader) for _ in range(readers)]
+               + [threading.Thread(target=writer, args=(n,)) for n in range(writers)])
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    reads, writes = sorted(read_latencies), sorted(write_latencies)
+    return {
+        "reads_per_s": round(len(reads) / seconds, 1),
+        "writes_per_s": round(len(writes) / seconds, 1),
+        "read_p50_ms": round(_percentile(reads, 50) * 1000, 2),
+        "read_p99_ms": round(_percentile(reads, 99) * 1000, 2),
+        "write_p50_ms": round(_percentile(writes, 50) * 1000, 2),
+        "write_p99_ms": round(_percentile(writes, 99) * 1000, 2),
+        "errors": errors,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=100_000, help="Articles seeded before the run")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="technonews-conc-")
+    profiles = {"defaults": {"foreign_keys": "ON"}, "tuned": sqlite_pragmas()}
+    results = {}
+    for name, pragmas in profiles.items():
+        engine = build_engine(os.path.join(workdir, f"{name}.db"), pragmas, args.readers + args.writers)
+        seed(engine, args.rows)
+        results[name] = run(engine, args.readers, args.writers, args.seconds)
+        engine.dispose()
+        r = results[name]
+        print(f"{name:<9} reads {r['reads_per_s']:>9}/s (p50 {r['read_p50_ms']}ms, p99 {r['read_p99_ms']}ms)  "
+              f"writes {r['writes_per_s']:>7}/s (p50 {r['write_p50_ms']}ms, p99 {r['write_p99_ms']}ms)  "
+              f"errors {r['errors']}")
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "pragmas": profiles, "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
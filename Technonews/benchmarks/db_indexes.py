@@ -0,0 +1,154 @@
+"""
+Query-plan and latency benchmark for the article/feedback schema.
+
+Builds a SQLite file with the pre-index schema (primary keys only), fills
+it with synthetic articles and feedback, times the queries the API issues
+and prints their EXPLAIN QUERY PLAN, then applies models.migrations and
+runs the same queries again.
+
+Usage (from the project directory):
+    python -m benchmarks.db_indexes                      # 1M articles, 1M feedback rows
+    python -m benchmarks.db_indexes --articles 100000 --json indexes.json
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import create_engine
+
+import models.article  # noqa: F401  (registers the tables on Base.metadata)
+import models.job  # noqa: F401
+from models.migrations import run_migrations
+
+LEGACY_SCHEMA = """
+CREATE TABLE articles (
+    id INTEGER NOT NULL PRIMARY KEY,
+    title VARCHAR(256) NOT NULL,
+    summary TEXT NOT NULL,
+    category VARCHAR(64) NOT NULL,
+    source_url VARCHAR(512) NOT NULL,
+    timestamp DATETIME NOT NULL
+);
+CREATE INDEX ix_articles_id ON articles (id);
+CREATE TABLE feedback (
+    id INTEGER NOT NULL PRIMARY KEY,
+    article_id INTEGER NOT NULL,
+    feedback VARCHAR(16) NOT NULL,
+    timestamp DATETIME NOT NULL
+);
+CREATE INDEX ix_feedback_id ON feedback (id);
+"""
+
+CATEGORIES = ["technology", "ai", "business", "health", "science", "security", "crypto", "other"]
+
+# (name, SQL, parameters) mirroring the queries issued by the routers
+QUERIES: List[Tuple[str, str, tuple]] = [
+    ("articles_first_page",
+     "SELECT * FROM articles ORDER BY timestamp DESC, id DESC LIMIT 51", ()),
+    ("articles_next_page",
+     "SELECT * FROM articles WHERE timestamp <= ? AND (timestamp < ? OR id < ?) "
+     "ORDER BY timestamp DESC, id DESC LIMIT 51", None),
+    ("articles_by_category",
+     "SELECT * FROM articles WHERE category = ? ORDER BY timestamp DESC, id DESC LIMIT 51", ("health",)),
+    ("articles_by_source",
+     "SELECT * FROM articles WHERE source_url >= ? AND source_url < ? ORDER BY timestamp DESC, id DESC LIMIT 51",
+     ("https://source7.example.com/", "https://source7.example.com0")),
+    ("articles_time_range",
+     "SELECT * FROM articles WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp DESC, id DESC LIMIT 51", None),
+    ("feedback_for_article",
+     "SELECT feedback, COUNT(*) FROM feedback WHERE article_id = ? GROUP BY feedback", (4242,)),
+    ("feedback_last_day",
+     "SELECT COUNT(*) FROM feedback WHERE timestamp >= ?", None),
+]
+
+def populate(path: str, articles: int, feedback: int, seed: int = 3) -> datetime:
+    """Create the legacy schema and fill it; returns the newest article timestamp."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.executemany(
+        "INSERT INTO articles (id, title, summary, category, source_url, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+        ((i, f"Article {i}", "Synthetic summary text. " * 4, rng.choice(CATEGORIES),
+          f"https://source{i % 50}.example.com/{i}", (start + timedelta(seconds=30 * i)).isoformat(" "))
+         for i in range(1, articles + 1))
+    )
+    conn.executemany(
+        "INSERT INTO feedback (article_id, feedback, timestamp) VALUES (?, ?, ?)",
+        ((rng.randint(1, articles), rng.choice(("like", "dislike")),
+          (start + timedelta(seconds=30 * rng.randint(1, articles))).isoformat(" "))
+         for _ in range(feedback))
+    )
+    conn.commit()
+    conn.close()
+    return start + timedelta(seconds=30 * articles)
+
+def parameters_for(name: str, params, newest: datetime) -> tuple:
+    if params is not None:
+        return params
+    middle = (newest - timedelta(days=30)).isoformat(" ")
+    if name == "articles_next_page":
+        return (middle, middle, 10**9)
+    if name == "articles_time_range":
+        return ((newest - timedelta(days=60)).isoformat(" "), middle)
+    return ((newest - timedelta(days=1)).isoformat(" "),)
+
+def run_queries(path: str, newest: datetime, repeat: int) -> Dict[str, Dict]:
+    conn = sqlite3.connect(path)
+    results = {}
+    for name, sql, params in QUERIES:
+        args = parameters_for(name, params, newest)
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, args)]
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(sql, args).fetchall()
+            timings.append(time.perf_counter() - started)
+        results[name] = {"ms": round(min(timings) * 1000, 3), "plan": plan}
+    conn.close()
+    return results
+
+def report(label: str, results: Dict[str, Dict]) -> None:
+    print(f"\n== {label}")
+    for name, result in results.items():
+        print(f"{name:<24} {result['ms']:>10.3f} ms   {' | '.join(result['plan'])}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--feedback", type=int, default=None, help="Feedback rows (default: same as --articles)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="technonews-idx-"), "bench.db")
+    print(f"Populating {path} ...")
+    newest = populate(path, args.articles, args.feedback if args.feedback is not None else args.articles)
+
+    before = run_queries(path, newest, args.repeat)
+    report("before migration (primary keys only)", before)
+
+    started = time.perf_counter()
+    version = run_migrations(create_engine(f"sqlite:///{path}"))
+    print(f"\nMigrated to schema version {version} in {time.perf_counter() - started:.1f}s")
+
+    after = run_queries(path, newest, args.repeat)
+    report("after migration", after)
+
+    print("\nspeedup:")
+    for name in before:
+        print(f"{name:<24} x{before[name]['ms'] / max(after[name]['ms'], 1e-6):.0f}")
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"articles": args.articles, "before": before, "after": after}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Local stand-in for the DeepSeek chat-completions API.
+
+Speaks the OpenAI-compatible request/response format, with configurable
+latency and error rates so load tests never touch api.deepseek.com.
+
+Usage:
+    python -m benchmarks.fake_deepseek --port 9100 --latency-ms 800 --error-rate 0.02
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+_ARTICLE_IDS = re.compile(r'^### Article (\d+)', re.MULTILINE)
+
+class FakeDeepSeekConfig:
+    """Behaviour knobs shared by all request handlers."""
+
+    def __init__(self, latency_ms: float = 500.0, jitter_ms: float = 200.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: float = 1.0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def draw(self):
+        """Pick latency and outcome for one request."""
+        with self.lock:
+            self.requests += 1
+            latency = max(0.0, self.random.gauss(self.latency_ms, self.jitter_ms)) / 1000.0
+            roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return latency, 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return latency, 500
+        return latency, 200
+
+def _fake_answer(messages: list) -> str:
+    """Build a plausible model answer for the prompt shapes DeepSeekService sends."""
+    user = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+    ids = _ARTICLE_IDS.findall(user)
+    if ids:
+        return json.dumps([
+            {"id": int(i), "title": f"Fake title {i}", "summary": "Fake summary. Second sentence.", "category": "technology"}
+            for i in ids
+        ])
+    if user.startswith("Section ") and " of " in user.split("\n", 1)[0]:
+        return "Fake partial summary of this section."
+    words = re.findall(r"\w+", user)[1:9]
+    return json.dumps({
+        "title": " ".join(words) or "Fake title",
+        "summary": "Fake summary generated by the local benchmark server. It has two sentences.",
+        "category": "technology"
+    })
+
+def _handler_for(config: FakeDeepSeekConfig):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return self._send(400, {"error": {"message": "invalid JSON"}})
+
+            latency, status = config.draw()
+            time.sleep(latency)
+
+            if status == 429:
+                return self._send(429, {"error": {"message": "rate limited"}},
+                                  {"Retry-After": str(config.retry_after)})
+            if status != 200:
+                return self._send(status, {"error": {"message": "fake upstream error"}})
+
+            messages = payload.get("messages", [])
+            content = _fake_answer(messages)
+            prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+            completion_tokens = len(content) // 4
+            self._send(200, {
+                "id": f"fake-{config.requests}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": payload.get("model", "deepseek-chat"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                    "prompt_cache_hit_tokens": 0,
+                    "prompt_cache_miss_tokens": prompt_tokens
+                }
+            })
+
+        def _send(self, status: int, body: dict, headers: Optional[dict] = None):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def start_fake_deepseek(port: int = 0, config: Optional[FakeDeepSeekConfig] = None) -> ThreadingHTTPServer:
+    """
+    Start the fake API in a background thread.
+
+    Args:
+        port: Port to bind (0 picks a free port)
+        config: Latency/error behaviour
+
+    Returns:
+        The running server; its chat-completions URL is
+        f"http://127.0.0.1:{server.server_port}/chat/completions"
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(config or FakeDeepSeekConfig()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-deepseek", daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=500.0)
+    parser.add_argument("--jitter-ms", type=float, default=200.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = FakeDeepSeekConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate, seed=args.seed)
+    server = start_fake_deepseek(args.port, config)
+    print(f"Fake DeepSeek listening on http://127.0.0.1:{server.server_port}/chat/completions")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Local RSS server for benchmarks.
+
+Serves recorded (or synthetic) feed files with strong ETags and answers
+If-None-Match with 304, so feed fetching can be load-tested offline.
+
+Usage:
+    # Record the live feeds from feeds.json once
+    python -m benchmarks.fake_rss --record benchmarks/fixtures/feeds
+
+    # Serve them (or synthetic feeds if no directory is given)
+    python -m benchmarks.fake_rss --port 9200 --fixtures benchmarks/fixtures/feeds
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+import requests
+
+TOPICS = ["AI", "machine learning", "Tesla", "electric vehicle", "bitcoin", "blockchain", "startup",
+          "cloud", "health", "medical research", "OpenAI", "chip", "cybersecurity", "quantum computing"]
+WORDS = ("announces launches report update market new model company users data platform growth "
+         "security release research funding deal team product").split()
+
+def generate_feed(name: str, entries: int, rng: random.Random) -> bytes:
+    """Build a synthetic RSS 2.0 document with HTML-laden summaries like real feeds."""
+    items = []
+    now = time.time()
+    for i in range(entries):
+        topic = rng.choice(TOPICS)
+        title = f"{topic} {' '.join(rng.choices(WORDS, k=6))}"
+        body = " ".join(rng.choices(WORDS, k=60))
+        summary = (f"<p>{escape(topic)} {body}.</p><p>{' '.join(rng.choices(WORDS, k=30))}.</p>"
+                   f"<p>The post {escape(title)} appeared first on {name}.</p>")
+        items.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>https://{name}.example.com/{i}</link>"
+            f"<description>{escape(summary)}</description>"
+            f"<pubDate>{formatdate(now - i * 600)}</pubDate>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{escape(name)}</title><link>https://{name}.example.com/</link>"
+        f"<description>Synthetic feed {escape(name)}</description>{''.join(items)}</channel></rss>"
+    ).encode()
+
+def write_synthetic_fixtures(out_dir: str, feeds: int = 10, entries: int = 30, seed: int = 42) -> List[str]:
+    """Write `feeds` synthetic feed files into out_dir and return their file names."""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    names = []
+    for i in range(feeds):
+        name = f"feed{i}.xml"
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(generate_feed(f"source{i}", entries, rng))
+        names.append(name)
+    return names
+
+def record_feeds(feeds_file: str, out_dir: str) -> List[str]:
+    """Download every feed listed in feeds_file into out_dir for later replay."""
+    with open(feeds_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    urls = data if isinstance(data, list) else data.get("feeds", [])
+
+    os.makedirs(out_dir, exist_ok=True)
+    names = []
+    for url in urls:
+        name = re.sub(r"[^A-Za-z0-9]+", "_", url).strip("_")[:80] + ".xml"
+        try:
+            response = requests.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0 technonews-bench"})
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"skip {url}: {e}")
+            continue
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(response.content)
+        names.append(name)
+        print(f"recorded {url} -> {name}")
+    return names
+
+def _handler_for(files: Dict[str, bytes]):
+    etags = {name: '"' + hashlib.sha1(body).hexdigest() + '"' for name, body in files.items()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            name = self.path.split("?", 1)[0].rsplit("/", 1)[-1]
+            if name not in files:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            etag = etags[name]
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            body = files[name]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "max-age=60")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def start_fake_rss(fixtures_dir: Optional[str] = None, port: int = 0):
+    """
+    Start the RSS server in a background thread.
+
+    Args:
+        fixtures_dir: Directory of recorded .xml feeds; synthetic feeds are
+            generated into a temporary directory when omitted
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        Tuple of (server, list of feed URLs)
+    """
+    if fixtures_dir is None:
+        fixtures_dir = tempfile.mkdtemp(prefix="technonews-rss-")
+        write_synthetic_fixtures(fixtures_dir)
+
+    files = {}
+    for name in sorted(os.listdir(fixtures_dir)):
+        if name.endswith(".xml"):
+            with open(os.path.join(fixtures_dir, name), "rb") as f:
+                files[name] = f.read()
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(files))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-rss", daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/feeds/{name}" for name in files]
+    return server, urls
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9200)
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded feeds to serve")
+    parser.add_argument("--record", metavar="DIR", help="Record the feeds listed in --feeds-file into DIR and exit")
+    parser.add_argument("--feeds-file", default="feeds.json")
+    args = parser.parse_args()
+
+    if args.record:
+        record_feeds(args.feeds_file, args.record)
+        return
+
+    server, urls = start_fake_rss(args.fixtures, args.port)
+    print("Serving feeds:\n  " + "\n  ".join(urls))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Write-throughput benchmark for the group-commit writer.
+
+Runs the same /store-style upserts from many concurrent coroutines twice:
+once with a commit per write on the async engine (the pre-writer path) and
+once through services.write_queue.group_writer, reporting writes/s and
+per-write latency. Writes go to a fresh database in a temporary directory,
+never to the configured DATABASE_URL; use --dir to put it on the disk you
+deploy to, as the gap grows with fsync cost (try SQLITE_SYNCHRONOUS=FULL).
+
+Usage (from the project directory):
+    python -m benchmarks.group_commit --concurrency 64 --writes 5000 --dir /var/lib/technonews
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+def _row(run: str, i: int) -> Dict:
+    return {"title": f"{run} {i}", "summary": "Benchmark summary. " * 10, "category": "technology",
+            "source_url": f"https://bench.example.com/{run}/{i}"}
+
+async def _commit_each(rows: List[Dict]) -> None:
+    from models.database import AsyncSessionLocal
+    from services.article_store import article_store
+
+    async with AsyncSessionLocal() as db:
+        await db.run_sync(article_store.upsert_many, rows)
+        await db.commit()
+
+async def _group_commit(rows: List[Dict]) -> None:
+    from services.article_store import article_store
+    from services.write_queue import group_writer
+
+    await group_writer.submit(article_store.upsert_many, rows)
+
+async def run(name: str, write, total: int, concurrency: int) -> Dict:
+    latencies: List[float] = []
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        for i in counter:
+            started = time.perf_counter()
+            await write([_row(f"{name}-{int(time.time())}", i)])
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "writes_per_s": round(total / wall, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+async def main_async(args) -> Dict:
+    # Imported only once main() has pointed DATABASE_URL at the benchmark database
+    import models.article  # noqa: F401  (registers the tables on Base.metadata)
+    import models.job  # noqa: F401
+    from models.database import async_engine, create_tables
+    from services.write_queue import group_writer
+
+    create_tables()
+    results = {"commit_per_write": await run("each", _commit_each, args.writes, args.concurrency)}
+    await group_writer.start()
+    results["group_commit"] = await run("group", _group_commit, args.writes, args.concurrency)
+    await group_writer.stop()
+    results["group_commit"]["mean_group_size"] = round(group_writer.writes_committed / max(group_writer.groups_committed, 1), 1)
+    await async_engine.dispose()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--dir", help="Directory for the benchmark database (default: system temp)")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    # The engines read these at import time
+    workdir = tempfile.mkdtemp(prefix="technonews-gc-", dir=args.dir)
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["ASYNC_DATABASE_URL"] = ""
+    try:
+        results = asyncio.run(main_async(args))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    for name, result in results.items():
+        print(f"{name:<18} {result}")
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
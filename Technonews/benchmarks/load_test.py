@@ -0,0 +1,199 @@
+"""
+End-to-end load test for the Technonews API.
+
+Starts a fake DeepSeek API and a fake RSS server, launches the app under
+uvicorn pointed at them (DEEPSEEK_API_URL, FEEDS_FILE and a throwaway
+DATABASE_URL), then runs repeatable scenarios and reports throughput and
+p50/p95/p99 latency.
+
+Usage (from the project directory):
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --scenario summarize --concurrency 32 --requests 500 --llm-latency-ms 1500
+    python -m benchmarks.load_test --json results.json
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from benchmarks.fake_deepseek import FakeDeepSeekConfig, start_fake_deepseek
+from benchmarks.fake_rss import start_fake_rss
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOPICS = ["AI", "Tesla", "bitcoin", "health", "startup", "cloud"]
+
+# A scenario returns (method, path, json_body) for request number i
+Scenario = Callable[[int, random.Random], Tuple[str, str, Optional[dict]]]
+
+def _article_text(rng: random.Random) -> str:
+    words = "model company launch market research data users growth security platform".split()
+    return "\n\n".join(" ".join(rng.choices(words, k=80)) + "." for _ in range(rng.randint(2, 6)))
+
+SCENARIOS: Dict[str, Scenario] = {
+    "news": lambda i, rng: ("GET", f"/news/{rng.choice(TOPICS)}?limit=10", None),
+    "summarize": lambda i, rng: ("POST", "/summarize/", {"article_text": _article_text(rng), "mode": "llm"}),
+    "store": lambda i, rng: ("POST", "/store", {
+        "title": f"Benchmark article {i}",
+        "summary": _article_text(rng)[:400],
+        "category": rng.choice(["technology", "health", "business"]),
+        "source_url": f"https://bench.example.com/{i}-{rng.random()}"
+    }),
+    "store_batch": lambda i, rng: ("POST", "/store/batch", {"articles": [
+        {
+            "title": f"Benchmark article {i}-{j}",
+            "summary": _article_text(rng)[:400],
+            "category": rng.choice(["technology", "health", "business"]),
+            "source_url": f"https://bench.example.com/{i}-{j}-{rng.random()}"
+        }
+        for j in range(100)
+    ]}),
+    "articles": lambda i, rng: ("GET", "/articles", None),
+}
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _percentile(ordered: List[float], p: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+def start_app(env_overrides: Dict[str, str], workdir: str) -> Tuple[subprocess.Popen, str]:
+    """Launch the app under uvicorn and wait until /health answers."""
+    port = _free_port()
+    env = {**os.environ, **env_overrides}
+    log = open(os.path.join(workdir, "app.log"), "wb")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=PROJECT_DIR, env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited early, see {log.name}")
+        try:
+            if requests.get(base_url + "/health", timeout=1).status_code == 200:
+                return process, base_url
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("App did not become healthy within 30s")
+
+def run_scenario(base_url: str, name: str, total: int, concurrency: int, seed: int) -> Dict:
+    """Fire `total` requests of one scenario with `concurrency` workers and summarize the latencies."""
+    scenario = SCENARIOS[name]
+    local = threading.local()
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def one(i: int) -> None:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        method, path, body = scenario(i, random.Random(seed * 1_000_003 + i))
+        started = time.perf_counter()
+        try:
+            response = session.request(method, base_url + path, json=body, timeout=120)
+            status = str(response.status_code)
+        except requests.RequestException as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            if not status.startswith("2"):
+                errors[status] = errors.get(status, 0) + 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    wall = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    ms = lambda value: None if value is None else round(value * 1000, 1)
+    return {
+        "scenario": name,
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(total / wall, 1),
+        "p50_ms": ms(_percentile(ordered, 50)),
+        "p95_ms": ms(_percentile(ordered, 95)),
+        "p99_ms": ms(_percentile(ordered, 99)),
+        "max_ms": ms(ordered[-1] if ordered else None),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable); default runs all")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--llm-latency-ms", type=float, default=500.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=150.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded feeds (default: synthetic)")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra environment for the app, e.g. --env SQLITE_JOURNAL_MODE=WAL")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="technonews-bench-")
+    llm = start_fake_deepseek(config=FakeDeepSeekConfig(
+        args.llm_latency_ms, args.llm_jitter_ms, args.llm_error_rate, args.llm_rate_limit_rate, seed=args.seed
+    ))
+    rss, feed_urls = start_fake_rss(args.fixtures)
+
+    feeds_file = os.path.join(workdir, "feeds.json")
+    with open(feeds_file, "w", encoding="utf-8") as f:
+        json.dump({"feeds": feed_urls, "websites": []}, f)
+
+    env = {
+        "DEEPSEEK_API_KEY": "benchmark",
+        "DEEPSEEK_API_URL": f"http://127.0.0.1:{llm.server_port}/chat/completions",
+        "FEEDS_FILE": feeds_file,
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "SUMMARIZE_WORKERS": "0",
+        "AUTO_SUMMARIZE_ENABLED": "false",
+        "LLM_REQUESTS_PER_MINUTE": "100000",
+        "LLM_TOKENS_PER_MINUTE": "1000000000",
+    }
+    env.update(item.split("=", 1) for item in args.env)
+
+    process, base_url = start_app(env, workdir)
+    results = []
+    try:
+        for name in args.scenario or ["store", "articles", "news", "summarize"]:
+            result = run_scenario(base_url, name, args.requests, args.concurrency, args.seed)
+            results.append(result)
+            print(f"{name:<10} {result['throughput_rps']:>8} req/s  p50 {result['p50_ms']}ms  "
+                  f"p95 {result['p95_ms']}ms  p99 {result['p99_ms']}ms  errors {result['errors']}")
+    finally:
+        process.terminate()
+        process.wait(10)
+        llm.shutdown()
+        rss.shutdown()
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"timestamp": time.time(), "args": vars(args), "results": results}, f, indent=2)
+        print(f"Results written to {args.json_out}")
+
+if __name__ == "__main__":
+    main()
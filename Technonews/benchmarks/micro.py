@@ -0,0 +1,199 @@
+"""
+Micro-benchmarks for the news filtering, trending and serialization hot paths.
+
+Each path is timed in isolation on synthetic corpora (no network), reporting
+the best-of-N wall time, per-item time and peak traced allocations. Results
+can be saved and compared against a previous run (e.g. from another commit)
+so regressions fail before deploy.
+
+The *_json benchmarks time a list response from the route's data to JSON
+bytes, both through the fast path the routes use (plain dicts encoded by
+FastJSONResponse) and through the response_model path it replaced (a
+Pydantic model per item, validated and dumped again by FastAPI).
+
+Usage (from the project directory):
+    python -m benchmarks.micro                                   # 1k, 10k, 100k entries
+    python -m benchmarks.micro --sizes 1000,1000000 --json after.json
+    python -m benchmarks.micro --json after.json --compare before.json --threshold 0.15
+"""
+import argparse
+import gc
+import json
+import logging
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from pydantic import TypeAdapter
+
+from core.responses import FastJSONResponse
+from schemas.article import ArticleResponse, NewsArticle, NewsResponse
+from services.news_fetcher import NewsFetcher
+from routers.articles import article_item
+from routers.news import build_news_response
+
+WORDS = ("ai model company launch market research data users growth security platform tesla battery "
+         "bitcoin crypto health medical startup cloud chip openai update report deal funding").split()
+
+def make_corpus(size: int, seed: int = 7) -> List[Dict]:
+    """Synthetic entries shaped like NewsFetcher._parse_rss_feed output."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(size):
+        corpus.append({
+            'title': " ".join(rng.choices(WORDS, k=8)).title(),
+            'summary': " ".join(rng.choices(WORDS, k=40)),
+            'link': f"https://source{i % 50}.example.com/{i}",
+            'published': "Mon, 06 Jan 2025 10:00:00 GMT",
+            'published_parsed': time.gmtime(1736157600 - i * 60),
+            'source': f"Source {i % 50}",
+            'source_url': f"https://source{i % 50}.example.com/feed"
+        })
+    return corpus
+
+def make_rows(size: int) -> List[Tuple]:
+    """Synthetic rows shaped like routers.articles.ARTICLE_COLUMNS results."""
+    start = datetime(2025, 1, 6, 10, 0, 0, 123456)
+    return [
+        (i, f"Article {i} about ai model launch", "Synthetic summary text. " * 12, "technology",
+         f"https://source{i % 50}.example.com/{i}", start - timedelta(seconds=30 * i), i % 7, i % 3, 0.25)
+        for i in range(size)
+    ]
+
+# FastAPI validates a returned value against response_model, then dumps it to JSON bytes
+_ARTICLES_ADAPTER = TypeAdapter(List[ArticleResponse])
+_NEWS_ADAPTER = TypeAdapter(NewsResponse)
+
+def _articles_json_pydantic(rows: List[Tuple]) -> bytes:
+    articles = [
+        ArticleResponse(id=row[0], title=row[1], summary=row[2], category=row[3], source_url=row[4],
+                        timestamp=row[5].isoformat(), likes=row[6], dislikes=row[7], score=row[8])
+        for row in rows
+    ]
+    return _ARTICLES_ADAPTER.dump_json(_ARTICLES_ADAPTER.validate_python(articles))
+
+def _news_json_pydantic(theme: str, corpus: List[Dict]) -> bytes:
+    articles = [
+        NewsArticle(title=entry.get('title', 'No Title'), summary=entry.get('summary', 'No Summary'),
+                    link=entry.get('link', ''), published=entry.get('published', ''),
+                    source=entry.get('source', 'Unknown'), source_url=entry.get('source_url', ''))
+        for entry in corpus
+    ]
+    response = NewsResponse(theme=theme, articles=articles, total_found=len(articles))
+    return _NEWS_ADAPTER.dump_json(_NEWS_ADAPTER.validate_python(response))
+
+class _StubFeeds:
+    def __init__(self, urls: List[str]):
+        self.urls = urls
+
+    def read_feeds(self) -> Dict[str, List[str]]:
+        return {"feeds": self.urls, "websites": []}
+
+def _trending_fetcher(corpus: List[Dict], per_feed: int = 5) -> NewsFetcher:
+    """A NewsFetcher whose feeds replay the corpus, so get_trending_topics sees every entry."""
+    chunks = {f"feed://{i}": corpus[start:start + per_feed]
+              for i, start in enumerate(range(0, len(corpus), per_feed))}
+    fetcher = NewsFetcher()
+    fetcher.feeds_service = _StubFeeds(list(chunks))
+    fetcher._parse_rss_feed = chunks.__getitem__
+    return fetcher
+
+def benchmarks_for(corpus: List[Dict]) -> Dict[str, Callable[[], object]]:
+    fetcher = NewsFetcher()
+    trending = _trending_fetcher(corpus)
+    themes = ["AI", "Tesla", "crypto", "tech", "health", "quantum"]
+    rows = make_rows(len(corpus))
+    return {
+        "filter_by_theme": lambda: fetcher._filter_by_theme(corpus, "AI"),
+        "generate_keywords": lambda: [fetcher._generate_keywords(themes[i % len(themes)]) for i in range(len(corpus))],
+        "get_trending_topics": trending.get_trending_topics,
+        "build_news_response": lambda: build_news_response("AI", corpus),
+        "news_json_pydantic": lambda: _news_json_pydantic("AI", corpus),
+        "news_json_fast": lambda: FastJSONResponse(build_news_response("AI", corpus)).body,
+        "articles_json_pydantic": lambda: _articles_json_pydantic(rows),
+        "articles_json_fast": lambda: FastJSONResponse([article_item(row) for row in rows]).body,
+    }
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Best-of-`repeat` wall time, then one traced run for peak allocations."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Names of benchmarks whose time or peak allocations grew by more than `threshold`."""
+    regressions = []
+    for key, result in current["results"].items():
+        before = baseline.get("results", {}).get(key)
+        if not before:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if before[metric] and result[metric] > before[metric] * (1 + threshold):
+                change = result[metric] / before[metric] - 1
+                regressions.append(f"{key} {metric}: {before[metric]:.6g} -> {result[metric]:.6g} (+{change:.0%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated corpus sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", action="append", help="Run only this benchmark (repeatable)")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON from a previous run")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown before failing")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    report = {"revision": git_revision(), "python": sys.version.split()[0], "results": {}}
+    for size in (int(s) for s in args.sizes.split(",")):
+        corpus = make_corpus(size)
+        repeat = args.repeat if size < 1_000_000 else max(1, args.repeat // 3)
+        for name, fn in benchmarks_for(corpus).items():
+            if args.only and name not in args.only:
+                continue
+            result = measure(fn, repeat)
+            result["ns_per_item"] = result["seconds"] / size * 1e9
+            report["results"][f"{name}[{size}]"] = result
+            print(f"{name:<22} n={size:<9} {result['seconds'] * 1000:>10.2f} ms  "
+                  f"{result['ns_per_item']:>9.0f} ns/item  peak {result['peak_bytes'] / 1024:>10.0f} KiB")
+        del corpus
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions vs {baseline.get('revision', args.compare)}:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"\nNo regressions vs {baseline.get('revision', args.compare)} (threshold {args.threshold:.0%})")
+
+if __name__ == "__main__":
+    main()
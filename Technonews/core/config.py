@@ -13,10 +13,27 @@ except (UnicodeDecodeError, FileNotFoundError) as e:
 class Settings(BaseSettings):
     # API Keys - Read from environment variables
     deepseek_api_key: str = os.getenv('DEEPSEEK_API_KEY', '')
-    deepseek_api_url: str = os.getenv('DEEPSEEK_API_URL', 'https://api.deepseek.com/v1/completions')
+    deepseek_api_url: str = os.getenv('DEEPSEEK_API_URL', 'https://api.deepseek.com/chat/completions')
     
     # Database
     database_url: str = os.getenv('DATABASE_URL', 'sqlite:///./technonews.db')
+    # Async driver URL for the request-path routes; derived from DATABASE_URL for SQLite
+    async_database_url: str = os.getenv('ASYNC_DATABASE_URL', '')
+    db_pool_size: int = int(os.getenv('DB_POOL_SIZE', '10'))
+    db_max_overflow: int = int(os.getenv('DB_MAX_OVERFLOW', '20'))
+    db_pool_timeout: float = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+    db_pool_recycle: int = int(os.getenv('DB_POOL_RECYCLE', '3600'))
+
+    # SQLite Tuning (PRAGMAs applied to every connection)
+    sqlite_tuning_enabled: bool = os.getenv('SQLITE_TUNING_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    sqlite_journal_mode: str = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    sqlite_synchronous: str = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    sqlite_busy_timeout_ms: int = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+    sqlite_cache_size: int = int(os.getenv('SQLITE_CACHE_SIZE', '-65536'))  # negative = KiB, i.e. 64 MiB
+    sqlite_mmap_size: int = int(os.getenv('SQLITE_MMAP_SIZE', '268435456'))
+    sqlite_temp_store: str = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
+    # Lets the retention job return freed pages to the OS a few at a time (takes effect on new or VACUUMed databases)
+    sqlite_auto_vacuum: str = os.getenv('SQLITE_AUTO_VACUUM', 'INCREMENTAL')
     
     # CORS - Support both string and list formats
     cors_origins: str = os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000')
@@ -28,6 +45,76 @@ class Settings(BaseSettings):
     
     # Files
     feeds_file: str = os.getenv('FEEDS_FILE', 'feeds.json')
+
+    # Group-Commit Writer
+    write_queue_enabled: bool = os.getenv('WRITE_QUEUE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+    write_queue_max_size: int = int(os.getenv('WRITE_QUEUE_MAX_SIZE', '10000'))
+    write_queue_timeout: float = float(os.getenv('WRITE_QUEUE_TIMEOUT', '5'))
+    write_batch_max_items: int = int(os.getenv('WRITE_BATCH_MAX_ITEMS', '256'))
+    write_batch_max_delay_ms: float = float(os.getenv('WRITE_BATCH_MAX_DELAY_MS', '2'))
+
+    # Bulk Article Storage
+    store_batch_max_items: int = int(os.getenv('STORE_BATCH_MAX_ITEMS', '5000'))
+    store_batch_chunk_size: int = int(os.getenv('STORE_BATCH_CHUNK_SIZE', '500'))
+
+    # Article Export (GET /articles/export)
+    # Rows fetched per server-side cursor batch; each batch is one streamed chunk
+    export_batch_size: int = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+    export_gzip_level: int = int(os.getenv('EXPORT_GZIP_LEVEL', '6'))
+
+    # Retention (articles older than RETENTION_DAYS move to monthly gzip NDJSON archives; 0 disables)
+    retention_days: int = int(os.getenv('RETENTION_DAYS', '0'))
+    retention_interval: int = int(os.getenv('RETENTION_INTERVAL', '86400'))  # seconds between runs
+    retention_batch_size: int = int(os.getenv('RETENTION_BATCH_SIZE', '500'))
+    retention_vacuum_pages: int = int(os.getenv('RETENTION_VACUUM_PAGES', '10000'))  # freed pages reclaimed per run
+    archive_dir: str = os.getenv('ARCHIVE_DIR', './archive')
+
+    # Article Facets (GET /articles/facets)
+    # In-process writes invalidate the cache at once; the TTL covers writes from manage.py
+    facets_cache_ttl: float = float(os.getenv('FACETS_CACHE_TTL', '60'))
+
+    # LLM Settings
+    llm_max_input_tokens: int = int(os.getenv('LLM_MAX_INPUT_TOKENS', '6000'))
+    llm_chunk_tokens: int = int(os.getenv('LLM_CHUNK_TOKENS', '3000'))
+    llm_max_chunks: int = int(os.getenv('LLM_MAX_CHUNKS', '8'))
+    llm_map_concurrency: int = int(os.getenv('LLM_MAP_CONCURRENCY', '8'))
+    llm_requests_per_minute: int = int(os.getenv('LLM_REQUESTS_PER_MINUTE', '60'))
+    llm_tokens_per_minute: int = int(os.getenv('LLM_TOKENS_PER_MINUTE', '200000'))
+    llm_queue_timeout: float = float(os.getenv('LLM_QUEUE_TIMEOUT', '60'))
+    llm_default_retry_after: float = float(os.getenv('LLM_DEFAULT_RETRY_AFTER', '5'))
+    llm_call_concurrency: int = int(os.getenv('LLM_CALL_CONCURRENCY', '32'))
+    llm_latency_budget: float = float(os.getenv('LLM_LATENCY_BUDGET', '10'))
+    llm_request_timeout: float = float(os.getenv('LLM_REQUEST_TIMEOUT', '30'))
+    llm_max_attempts: int = int(os.getenv('LLM_MAX_ATTEMPTS', '3'))
+    llm_retry_base_delay: float = float(os.getenv('LLM_RETRY_BASE_DELAY', '0.5'))
+    llm_retry_max_delay: float = float(os.getenv('LLM_RETRY_MAX_DELAY', '8'))
+    llm_hedging_enabled: bool = os.getenv('LLM_HEDGING_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    llm_hedge_percentile: float = float(os.getenv('LLM_HEDGE_PERCENTILE', '95'))
+    llm_batch_max_items: int = int(os.getenv('LLM_BATCH_MAX_ITEMS', '20'))
+    llm_batch_max_input_tokens: int = int(os.getenv('LLM_BATCH_MAX_INPUT_TOKENS', '6000'))
+    llm_batch_item_max_tokens: int = int(os.getenv('LLM_BATCH_ITEM_MAX_TOKENS', '1500'))
+    summarize_deadline: float = float(os.getenv('SUMMARIZE_DEADLINE', '30'))
+    llm_stats_capacity: int = int(os.getenv('LLM_STATS_CAPACITY', '0'))  # 0 = enough for 24h at the RPM limit
+    # USD per million tokens, used for cost estimates in /summarize/stats
+    llm_price_input_per_mtok: float = float(os.getenv('LLM_PRICE_INPUT_PER_MTOK', '0.27'))
+    llm_price_cached_input_per_mtok: float = float(os.getenv('LLM_PRICE_CACHED_INPUT_PER_MTOK', '0.07'))
+    llm_price_output_per_mtok: float = float(os.getenv('LLM_PRICE_OUTPUT_PER_MTOK', '1.10'))
+    summarize_mode: str = os.getenv('SUMMARIZE_MODE', 'auto')  # llm, fast or auto
+    extractive_max_sentences: int = int(os.getenv('EXTRACTIVE_MAX_SENTENCES', '200'))
+
+    # Summarization Jobs
+    summarize_workers: int = int(os.getenv('SUMMARIZE_WORKERS', '2'))
+    summarize_job_poll_interval: float = float(os.getenv('SUMMARIZE_JOB_POLL_INTERVAL', '1.0'))
+    summarize_job_lease_seconds: int = int(os.getenv('SUMMARIZE_JOB_LEASE_SECONDS', '300'))
+    summarize_job_max_attempts: int = int(os.getenv('SUMMARIZE_JOB_MAX_ATTEMPTS', '3'))
+    summarize_job_retry_base_delay: float = float(os.getenv('SUMMARIZE_JOB_RETRY_BASE_DELAY', '10'))
+    summarize_job_retry_max_delay: float = float(os.getenv('SUMMARIZE_JOB_RETRY_MAX_DELAY', '600'))
+
+    # Feed Auto-Summarization
+    auto_summarize_enabled: bool = os.getenv('AUTO_SUMMARIZE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    auto_summarize_interval: int = int(os.getenv('AUTO_SUMMARIZE_INTERVAL', '900'))
+    auto_summarize_batch_size: int = int(os.getenv('AUTO_SUMMARIZE_BATCH_SIZE', '20'))
+    auto_summarize_max_per_cycle: int = int(os.getenv('AUTO_SUMMARIZE_MAX_PER_CYCLE', '50'))
     
     # API Settings
     api_title: str = "Technonews Summarizer API"
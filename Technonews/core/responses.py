@@ -0,0 +1,22 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+class FastJSONResponse(Response):
+    """
+    JSON response serialized with orjson, for payloads already shaped like the
+    route's response model.
+
+    Returning a Response from a route bypasses FastAPI's response_model
+    validation and serialization, so list endpoints can build plain dicts
+    straight from rows and encode them once, instead of constructing a
+    Pydantic model per item and then validating and dumping it again. The
+    route keeps its `response_model` for the OpenAPI schema; the payload must
+    match it.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -5,8 +5,12 @@ from fastapi.responses import RedirectResponse
 
 from core.config import settings
 from core.logging import get_logger
-from models.database import create_tables
-from routers import summarize, articles, feedback, feeds, news
+from models.database import create_tables, async_engine
+from services.write_queue import group_writer
+from routers import summarize, articles, feedback, feeds, news, analytics
+from services.jobs import summarization_jobs
+from services.ingest import feed_ingestor
+from services.retention import article_archiver
 
 # Set up logging
 logger = get_logger(__name__)
@@ -22,10 +26,19 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Technonews API...")
     logger.info(f"CORS origins: {settings.cors_origins_list}")
     create_tables()
+    await group_writer.start()
+    summarization_jobs.start()
+    feed_ingestor.start()
+    article_archiver.start()
     logger.info("Technonews API started successfully")
     yield
     # Shutdown
     logger.info("Shutting down Technonews API...")
+    article_archiver.stop()
+    feed_ingestor.stop()
+    summarization_jobs.stop()
+    await group_writer.stop()
+    await async_engine.dispose()
 
 # Create FastAPI app with lifespan
 app = FastAPI(
@@ -50,6 +63,7 @@ app.include_router(articles.router)
 app.include_router(feedback.router)
 app.include_router(feeds.router)
 app.include_router(news.router)
+app.include_router(analytics.router)
 
 # Mount static files for the frontend
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -67,11 +81,13 @@ def api_status():
         "version": settings.api_version,
         "endpoints": {
             "summarize": "/summarize",
+            "summarize_jobs": "/summarize/jobs",
             "store": "/store", 
             "articles": "/articles",
             "feedback": "/feedback",
             "feeds": "/feeds",
-            "news": "/news/{theme}"
+            "news": "/news/{theme}",
+            "analytics": "/analytics/feedback"
         }
     }
 
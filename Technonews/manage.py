@@ -0,0 +1,66 @@
+"""
+Maintenance commands for the Technonews database.
+
+Usage (from the project directory):
+    python manage.py compact-articles
+    python manage.py export-parquet --out exports/          # rows added since the last run
+    python manage.py export-parquet --out exports/ --full   # rewrite everything
+    python manage.py archive --days 365                     # move older articles to ARCHIVE_DIR
+"""
+import argparse
+import json
+import sys
+
+import models.article  # noqa: F401  (registers the tables on Base.metadata)
+import models.job  # noqa: F401
+from core.config import settings
+from models.database import create_tables, engine
+from services.maintenance import compact_articles
+from services.parquet_export import export_parquet
+from services.retention import article_archiver
+
+def cmd_compact_articles(args) -> None:
+    print(json.dumps(compact_articles(engine), indent=2))
+
+def cmd_export_parquet(args) -> None:
+    try:
+        report = export_parquet(engine, args.out, batch_size=args.batch_size, full=args.full,
+                                compression=args.compression)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    print(json.dumps(report, indent=2))
+
+def cmd_archive(args) -> None:
+    days = args.days or settings.retention_days
+    if days <= 0:
+        sys.exit("Set RETENTION_DAYS or pass --days")
+    print(json.dumps(article_archiver.run_once(days), indent=2))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compact = commands.add_parser("compact-articles",
+                                  help="Deduplicate articles by normalized URL, then VACUUM and ANALYZE")
+    compact.set_defaults(handler=cmd_compact_articles)
+
+    parquet = commands.add_parser("export-parquet",
+                                  help="Write articles and feedback to Parquet (incremental by default; needs pyarrow)")
+    parquet.add_argument("--out", required=True, help="Output directory (one dataset directory per table)")
+    parquet.add_argument("--batch-size", type=int, default=50_000, help="Rows per read and per row group")
+    parquet.add_argument("--full", action="store_true", help="Ignore the watermark and re-export everything")
+    parquet.add_argument("--compression", default="zstd", help="Parquet codec (zstd, snappy, gzip, none)")
+    parquet.set_defaults(handler=cmd_export_parquet)
+
+    archive = commands.add_parser("archive",
+                                  help="Move articles older than the retention period to monthly gzip archives")
+    archive.add_argument("--days", type=int, help="Retention period in days (default: RETENTION_DAYS)")
+    archive.set_defaults(handler=cmd_archive)
+
+    args = parser.parse_args()
+    # Bring the schema up to date before touching it
+    create_tables()
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
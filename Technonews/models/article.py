@@ -1,23 +1,86 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Index, ForeignKey
 from datetime import datetime
 from models.database import Base
+from services.preprocess import normalize_url, url_host
+
+def _url_key_default(context) -> str:
+    return normalize_url(context.get_current_parameters()["source_url"])
+
+def _source_default(context) -> str:
+    return url_host(context.get_current_parameters()["source_url"])
 
 class Article(Base):
     """SQLAlchemy model for storing news articles."""
     __tablename__ = "articles"
+    __table_args__ = (
+        # Keyset pagination for GET /articles, optionally filtered by category
+        Index("ix_articles_timestamp_id", "timestamp", "id"),
+        Index("ix_articles_category_timestamp_id", "category", "timestamp", "id"),
+        Index("ix_articles_source_url", "source_url"),
+        Index("ix_articles_source_timestamp_id", "source", "timestamp", "id"),
+        # One row per normalized URL; the conflict target for upserts
+        Index("ux_articles_url_key", "url_key", unique=True),
+        # Ids of archived articles are never reused (see migration 6)
+        {"sqlite_autoincrement": True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)  # type: ignore
     title = Column(String(256), nullable=False)  # type: ignore
     summary = Column(Text, nullable=False)  # type: ignore
     category = Column(String(64), nullable=False)  # type: ignore
     source_url = Column(String(512), nullable=False)  # type: ignore
+    url_key = Column(String(512), nullable=False, default=_url_key_default)  # type: ignore  # normalize_url(source_url)
+    source = Column(String(255), nullable=False, default=_source_default)  # type: ignore  # publisher host
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)  # type: ignore
 
 class Feedback(Base):
     """SQLAlchemy model for storing user feedback on articles."""
     __tablename__ = "feedback"
+    __table_args__ = (
+        # Per-article like/dislike counts are answered from this index alone
+        Index("ix_feedback_article_id_feedback", "article_id", "feedback"),
+        Index("ix_feedback_timestamp", "timestamp"),
+        {"sqlite_autoincrement": True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)  # type: ignore
-    article_id = Column(Integer, nullable=False)  # type: ignore
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)  # type: ignore
     feedback = Column(String(16), nullable=False)  # type: ignore  # 'like' or 'dislike'
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)  # type: ignore 
\ No newline at end of file
+    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)  # type: ignore 
+
+class ArticleRating(Base):
+    """Per-article feedback counters, updated in the same transaction as each Feedback row."""
+    __tablename__ = "article_ratings"
+    __table_args__ = (
+        # GET /articles/top walks this index from the highest score down
+        Index("ix_article_ratings_score", "score", "article_id"),
+    )
+    
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)  # type: ignore
+    likes = Column(Integer, nullable=False, default=0)  # type: ignore
+    dislikes = Column(Integer, nullable=False, default=0)  # type: ignore
+    score = Column(Float, nullable=False, default=0.0)  # type: ignore  # Wilson score lower bound of likes
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # type: ignore
+
+class FeedbackRollup(Base):
+    """Like/dislike totals per time bucket, category and source, updated with each vote."""
+    __tablename__ = "feedback_rollups"
+    
+    granularity = Column(String(8), primary_key=True)  # type: ignore  # 'hour' or 'day'
+    bucket = Column(DateTime, primary_key=True)  # type: ignore  # start of the hour/day (UTC)
+    category = Column(String(64), primary_key=True)  # type: ignore  # article category at vote time
+    source = Column(String(255), primary_key=True)  # type: ignore
+    likes = Column(Integer, nullable=False, default=0)  # type: ignore
+    dislikes = Column(Integer, nullable=False, default=0)  # type: ignore
+
+class ArticleFacet(Base):
+    """
+    Number of stored articles per category and per source, kept current by
+    SQLite triggers on articles (see migration 5), so every insert, upsert
+    and delete path updates it, including raw-SQL compaction.
+    """
+    __tablename__ = "article_facets"
+    
+    dimension = Column(String(16), primary_key=True)  # type: ignore  # 'category' or 'source'
+    value = Column(String(255), primary_key=True)  # type: ignore
+    count = Column(Integer, nullable=False, default=0)  # type: ignore
@@ -1,24 +1,126 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Dict, Generator
 from core.config import settings
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+def sqlite_pragmas() -> Dict[str, str]:
+    """PRAGMAs applied to every new SQLite connection, from the SQLITE_* settings."""
+    pragmas = {"foreign_keys": "ON"}
+    if settings.sqlite_tuning_enabled:
+        pragmas.update({
+            # Before journal_mode: only applies while a new database is still empty
+            "auto_vacuum": settings.sqlite_auto_vacuum,
+            "journal_mode": settings.sqlite_journal_mode,
+            "synchronous": settings.sqlite_synchronous,
+            "busy_timeout": str(settings.sqlite_busy_timeout_ms),
+            "cache_size": str(settings.sqlite_cache_size),
+            "mmap_size": str(settings.sqlite_mmap_size),
+            "temp_store": settings.sqlite_temp_store,
+        })
+    return pragmas
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, str]) -> None:
+    """Run `pragmas` on each DBAPI connection the engine opens."""
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+def _engine_options(url: str) -> Dict:
+    """Pool settings, skipped for in-memory SQLite which needs a single connection."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url, 
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    **_engine_options(settings.database_url)
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _async_database_url() -> str:
+    """ASYNC_DATABASE_URL if set, else DATABASE_URL with SQLite switched to aiosqlite."""
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    return settings.database_url
+
+# Async engine for the request-path article and feedback routes; background
+# workers (jobs, feed ingestion) keep using the sync engine above
+async_engine = create_async_engine(_async_database_url(), **_engine_options(_async_database_url()))
+
+if engine.dialect.name == "sqlite":
+    apply_sqlite_pragmas(engine, sqlite_pragmas())
+if async_engine.dialect.name == "sqlite":
+    apply_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas())
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def _enable_sqlite_savepoints(engine: Engine) -> None:
+    """
+    Let SQLAlchemy issue BEGIN itself so SAVEPOINTs work on pysqlite.
+
+    pysqlite otherwise starts transactions lazily before the first DML,
+    which breaks nested transactions. BEGIN IMMEDIATE takes the write lock
+    up front, as the engine is only used for writes.
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+# Dedicated single-connection engine for the group-commit writer
+# (services/write_queue.py); SQLite allows one writer at a time anyway
+writer_engine = create_engine(
+    settings.database_url,
+    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    pool_size=1,
+    max_overflow=0
+)
+
+if writer_engine.dialect.name == "sqlite":
+    apply_sqlite_pragmas(writer_engine, sqlite_pragmas())
+    _enable_sqlite_savepoints(writer_engine)
+
+WriterSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=writer_engine)
+
 # Create Base class for models
 Base = declarative_base()
 
+def upsert_insert(dialect_name: str, model):
+    """INSERT construct for `model` supporting on_conflict_do_update on this dialect."""
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    raise NotImplementedError(f"Upserts are not supported on {dialect_name}")
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
@@ -36,11 +138,29 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+    
+    Yields:
+        AsyncSession that automatically closes after use
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {str(e)}")
+            await db.rollback()
+            raise
+
 def create_tables():
-    """Create all database tables."""
+    """Create all database tables and upgrade the schema of existing ones."""
+    from models.migrations import run_migrations
+    
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
+    version = run_migrations(engine)
+    logger.info(f"Database tables created successfully (schema version {version})")
 
 def drop_tables():
     """Drop all database tables (use with caution!)."""
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from datetime import datetime
+from models.database import Base
+
+# Job lifecycle states
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+class SummarizationJob(Base):
+    """SQLAlchemy model for queued article summarization jobs."""
+    __tablename__ = "summarization_jobs"
+    __table_args__ = (
+        Index("ix_summarization_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(String(32), primary_key=True)  # type: ignore
+    status = Column(String(16), nullable=False, default=JOB_PENDING)  # type: ignore
+    article_text = Column(Text, nullable=False)  # type: ignore
+    result = Column(Text, nullable=True)  # type: ignore  # JSON-encoded SummarizeResponse
+    error = Column(Text, nullable=True)  # type: ignore
+    attempts = Column(Integer, nullable=False, default=0)  # type: ignore
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # type: ignore
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # type: ignore
+    started_at = Column(DateTime, nullable=True)  # type: ignore  # lease start while running
+    available_at = Column(DateTime, nullable=True)  # type: ignore  # not claimed before this time (retry backoff)
@@ -0,0 +1,293 @@
+"""
+Lightweight schema migrations for existing SQLite databases.
+
+`Base.metadata.create_all` only creates missing tables, so indexes and
+constraints added to existing models never reach a database created by an
+older release. Each migration below upgrades such a file in place; the
+applied version is tracked in SQLite's `PRAGMA user_version`.
+
+Migrations must be idempotent: a fresh database already gets the current
+schema from `create_all`, and the migrations then run over it as no-ops.
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Index
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from models.database import Base
+from services.preprocess import normalize_url, url_host
+from services.ratings import wilson_lower_bound
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+def _create_indexes(conn: Connection, *table_names: str) -> List[str]:
+    """
+    CREATE INDEX IF NOT EXISTS for every index declared on the given models,
+    except those on columns the live table does not have yet (the migration
+    adding the column creates them).
+    """
+    statements = []
+    for name in table_names:
+        columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({name})")}
+        for index in sorted(Base.metadata.tables[name].indexes, key=lambda i: i.name):
+            if not {column.name for column in index.columns} <= columns:
+                continue
+            statements.append(_create_index(conn, index))
+    return statements
+
+def _create_index(conn: Connection, index: Index) -> str:
+    ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+    return (ddl.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1)
+               .replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX IF NOT EXISTS", 1))
+
+def _create_table(conn: Connection, table_name: str) -> str:
+    """CREATE TABLE IF NOT EXISTS for a model table, for migrations that fill tables create_all may not have made."""
+    return str(CreateTable(Base.metadata.tables[table_name], if_not_exists=True).compile(dialect=conn.dialect)).strip()
+
+def _index(table_name: str, index_name: str) -> Index:
+    return next(i for i in Base.metadata.tables[table_name].indexes if i.name == index_name)
+
+def _rebuild_feedback_with_foreign_key(conn: Connection) -> List[str]:
+    """
+    SQLite cannot add a constraint to an existing table, so copy feedback
+    into a fresh table declared with `article_id REFERENCES articles(id)`.
+    Rows pointing at articles that no longer exist are dropped.
+    """
+    if conn.exec_driver_sql("PRAGMA foreign_key_list(feedback)").fetchall():
+        return []
+
+    orphans = conn.exec_driver_sql(
+        "SELECT COUNT(*) FROM feedback WHERE article_id NOT IN (SELECT id FROM articles)"
+    ).scalar()
+    if orphans:
+        logger.warning(f"Dropping {orphans} feedback rows for articles that no longer exist")
+
+    feedback = Base.metadata.tables["feedback"]
+    old_indexes = [row[0] for row in conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'feedback' AND sql IS NOT NULL"
+    )]
+    return (
+        ["ALTER TABLE feedback RENAME TO feedback_old"]
+        + [f'DROP INDEX "{name}"' for name in old_indexes]
+        + [str(CreateTable(feedback).compile(dialect=conn.dialect)).strip()]
+        + [str(CreateIndex(index).compile(dialect=conn.dialect)) for index in feedback.indexes]
+        + ["INSERT INTO feedback (id, article_id, feedback, timestamp) "
+           "SELECT id, article_id, feedback, timestamp FROM feedback_old "
+           "WHERE article_id IN (SELECT id FROM articles)",
+           "DROP TABLE feedback_old"]
+    )
+
+# Collapse articles sharing a url_key onto the most recently stored row,
+# moving their feedback to it first
+DEDUPLICATE_ARTICLES = [
+    "CREATE TEMP TABLE article_duplicates AS "
+    "SELECT a.id AS old_id, k.keep_id AS new_id FROM articles a "
+    "JOIN (SELECT url_key, MAX(id) AS keep_id FROM articles GROUP BY url_key HAVING COUNT(*) > 1) k "
+    "ON a.url_key = k.url_key WHERE a.id <> k.keep_id",
+    "UPDATE feedback SET article_id = (SELECT new_id FROM article_duplicates WHERE old_id = feedback.article_id) "
+    "WHERE article_id IN (SELECT old_id FROM article_duplicates)",
+    "DELETE FROM articles WHERE id IN (SELECT old_id FROM article_duplicates)",
+    "DROP TABLE article_duplicates",
+]
+
+# Rebuild every article's like/dislike counters and score from its feedback rows
+RECOMPUTE_ARTICLE_RATINGS = (
+    "INSERT OR REPLACE INTO article_ratings (article_id, likes, dislikes, score, updated_at) "
+    "SELECT article_id, likes, dislikes, wilson_lower_bound(likes, dislikes), CURRENT_TIMESTAMP FROM ("
+    "SELECT article_id, SUM(feedback = 'like') AS likes, SUM(feedback = 'dislike') AS dislikes "
+    "FROM feedback GROUP BY article_id)"
+)
+
+def _v1_indexes_and_feedback_foreign_key(conn: Connection) -> List[str]:
+    return (
+        _create_indexes(conn, "articles")
+        + _rebuild_feedback_with_foreign_key(conn)
+        + _create_indexes(conn, "feedback")
+    )
+
+def _v2_article_url_key(conn: Connection) -> List[str]:
+    columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(articles)")]
+    add_column = [] if "url_key" in columns else [
+        "ALTER TABLE articles ADD COLUMN url_key VARCHAR(512) NOT NULL DEFAULT ''"
+    ]
+    return (
+        add_column
+        + ["UPDATE articles SET url_key = normalize_url(source_url) WHERE url_key = ''"]
+        + DEDUPLICATE_ARTICLES
+        + [_create_index(conn, _index("articles", "ux_articles_url_key"))]
+    )
+
+def _v3_article_ratings(conn: Connection) -> List[str]:
+    # create_all has already created the table; fill its counters from existing feedback
+    return (
+        [_create_table(conn, "article_ratings"),
+         _create_index(conn, _index("article_ratings", "ix_article_ratings_score")),
+         RECOMPUTE_ARTICLE_RATINGS]
+    )
+
+def _rollup_backfill(granularity: str, bucket_format: str) -> str:
+    return (
+        "INSERT OR REPLACE INTO feedback_rollups (granularity, bucket, category, source, likes, dislikes) "
+        f"SELECT '{granularity}', strftime('{bucket_format}', f.timestamp), a.category, a.source, "
+        "SUM(f.feedback = 'like'), SUM(f.feedback = 'dislike') "
+        "FROM feedback f JOIN articles a ON a.id = f.article_id GROUP BY 2, 3, 4"
+    )
+
+def _v4_article_source_and_feedback_rollups(conn: Connection) -> List[str]:
+    columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(articles)")]
+    add_column = [] if "source" in columns else [
+        "ALTER TABLE articles ADD COLUMN source VARCHAR(255) NOT NULL DEFAULT ''"
+    ]
+    # Bucket strings match SQLAlchemy's SQLite DATETIME storage format
+    return (
+        add_column
+        + [_create_table(conn, "feedback_rollups"),
+           "UPDATE articles SET source = url_host(source_url) WHERE source = ''",
+           _create_index(conn, _index("articles", "ix_articles_source_timestamp_id")),
+           _rollup_backfill("hour", "%Y-%m-%d %H:00:00.000000"),
+           _rollup_backfill("day", "%Y-%m-%d 00:00:00.000000")]
+    )
+
+def _facet_triggers(dimension: str) -> List[str]:
+    """Triggers keeping article_facets counts for one articles column in step with the table."""
+    increment = (f"INSERT INTO article_facets (dimension, value, count) VALUES ('{dimension}', NEW.{dimension}, 1) "
+                 "ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1")
+    decrement = (f"UPDATE article_facets SET count = count - 1 "
+                 f"WHERE dimension = '{dimension}' AND value = OLD.{dimension}; "
+                 f"DELETE FROM article_facets WHERE dimension = '{dimension}' AND value = OLD.{dimension} AND count <= 0")
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS article_facets_{dimension}_insert AFTER INSERT ON articles "
+        f"BEGIN {increment}; END",
+        f"CREATE TRIGGER IF NOT EXISTS article_facets_{dimension}_delete AFTER DELETE ON articles "
+        f"BEGIN {decrement}; END",
+        # Upserts that change the value fire UPDATE triggers, not INSERT ones
+        f"CREATE TRIGGER IF NOT EXISTS article_facets_{dimension}_update AFTER UPDATE OF {dimension} ON articles "
+        f"WHEN OLD.{dimension} IS NOT NEW.{dimension} BEGIN {decrement}; {increment}; END",
+    ]
+
+def _v5_article_facets(conn: Connection) -> List[str]:
+    return (
+        [_create_table(conn, "article_facets"), "DELETE FROM article_facets"]
+        + [f"INSERT INTO article_facets (dimension, value, count) "
+           f"SELECT '{dimension}', {dimension}, COUNT(*) FROM articles GROUP BY {dimension}"
+           for dimension in ("category", "source")]
+        + _facet_triggers("category")
+        + _facet_triggers("source")
+    )
+
+def _rebuild_with_autoincrement(conn: Connection, table_name: str) -> List[str]:
+    """
+    Copy a table into a fresh one declared with AUTOINCREMENT, so ids freed
+    by archiving are never handed out again. The new table is built under a
+    temporary name and renamed over the old one, leaving foreign keys that
+    reference it untouched; its indexes are recreated afterwards. Inserting
+    the existing ids seeds sqlite_sequence with the current maximum.
+    """
+    table_sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+    ).scalar()
+    if "AUTOINCREMENT" in table_sql.upper():
+        return []
+
+    table = Base.metadata.tables[table_name]
+    columns = ", ".join(column.name for column in table.columns)
+    create = str(CreateTable(table).compile(dialect=conn.dialect)).strip()
+    return (
+        [create.replace(f"CREATE TABLE {table_name} ", f"CREATE TABLE {table_name}_new ", 1),
+         f"INSERT INTO {table_name}_new ({columns}) SELECT {columns} FROM {table_name} ORDER BY id",
+         f"DROP TABLE {table_name}",
+         f"ALTER TABLE {table_name}_new RENAME TO {table_name}"]
+        + [_create_index(conn, index) for index in sorted(table.indexes, key=lambda i: i.name)]
+    )
+
+def _v6_autoincrement_ids(conn: Connection) -> List[str]:
+    statements = _rebuild_with_autoincrement(conn, "articles")
+    # Dropping articles dropped its facet triggers too
+    if statements:
+        statements += _facet_triggers("category") + _facet_triggers("source")
+    return statements + _rebuild_with_autoincrement(conn, "feedback")
+
+def _v7_job_available_at(conn: Connection) -> List[str]:
+    columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(summarization_jobs)")]
+    return [] if "available_at" in columns else ["ALTER TABLE summarization_jobs ADD COLUMN available_at DATETIME"]
+
+# (version, description, builder returning the SQL statements to run)
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], List[str]]]] = [
+    (1, "article/feedback indexes and feedback.article_id foreign key", _v1_indexes_and_feedback_foreign_key),
+    (2, "articles.url_key unique normalized URL, duplicates removed", _v2_article_url_key),
+    (3, "article_ratings counters backfilled from feedback", _v3_article_ratings),
+    (4, "articles.source host column and feedback_rollups backfill", _v4_article_source_and_feedback_rollups),
+    (5, "article_facets category/source counts maintained by triggers", _v5_article_facets),
+    (6, "articles/feedback ids never reused (AUTOINCREMENT)", _v6_autoincrement_ids),
+    (7, "summarization_jobs.available_at retry backoff", _v7_job_available_at),
+]
+
+# Migrations that drop tables other tables reference: they run with foreign
+# key enforcement off, or DROP TABLE would cascade into the child rows
+REBUILDS_PARENT_TABLES = {6}
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def run_script(conn: Connection, statements: List[str], foreign_keys: bool = True) -> None:
+    """
+    Run `statements` as one SQLite transaction on the connection's DBAPI handle.
+
+    The pysqlite driver runs DDL outside transactions, so the statements are
+    issued as a single explicit BEGIN ... COMMIT script to make them
+    all-or-nothing. SQL functions used by migrations are registered first.
+    With `foreign_keys` False, enforcement (which SQLite only toggles outside
+    a transaction) is off for the script and restored afterwards.
+    """
+    raw = conn.connection.dbapi_connection
+    raw.create_function("normalize_url", 1, normalize_url, deterministic=True)
+    raw.create_function("url_host", 1, url_host, deterministic=True)
+    raw.create_function("wilson_lower_bound", 2, wilson_lower_bound, deterministic=True)
+    enforced = raw.execute("PRAGMA foreign_keys").fetchone()[0]
+    script = ";\n".join(["BEGIN"] + statements + ["COMMIT"])
+    try:
+        if not foreign_keys:
+            raw.execute("PRAGMA foreign_keys = OFF")
+        raw.executescript(script + ";")
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        if not foreign_keys:
+            raw.execute(f"PRAGMA foreign_keys = {'ON' if enforced else 'OFF'}")
+
+def run_migrations(engine: Engine) -> int:
+    """
+    Apply all pending migrations, each in its own transaction.
+
+    Args:
+        engine: Engine for the database to upgrade
+
+    Returns:
+        The schema version after migrating
+    """
+    if engine.dialect.name != "sqlite":
+        logger.info("Schema migrations are only tracked for SQLite; skipping")
+        return LATEST_VERSION
+
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    start_version = version
+
+    for target, description, build in MIGRATIONS:
+        if target <= version:
+            continue
+        logger.info(f"Migrating database schema to version {target}: {description}")
+        with engine.connect() as conn:
+            statements = build(conn)
+            conn.rollback()
+            run_script(conn, statements + [f"PRAGMA user_version = {target}"],
+                       foreign_keys=target not in REBUILDS_PARENT_TABLES)
+        version = target
+
+    with engine.connect() as conn:
+        # Fresh statistics after a migration so the planner picks the new indexes
+        conn.exec_driver_sql("ANALYZE" if version != start_version else "PRAGMA optimize")
+        conn.commit()
+    return version
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from schemas.article import (
+    FeedbackBucket, FeedbackSeriesResponse, FeedbackTotal, FeedbackTotalsResponse
+)
+from models.article import FeedbackRollup
+from models.database import get_async_db
+from services.analytics import GRANULARITIES
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+# Default reporting range when `since` is omitted
+DEFAULT_RANGE = {"hour": timedelta(days=2), "day": timedelta(days=30)}
+
+@router.get("/feedback", response_model=FeedbackSeriesResponse)
+async def get_feedback_series(
+    granularity: Literal["hour", "day"] = Query(default="day", description="Bucket size"),
+    since: Optional[datetime] = Query(default=None, description="Start of the range (default: 2 days / 30 days back)"),
+    until: Optional[datetime] = Query(default=None, description="End of the range (default: now)"),
+    group_by: Literal["category", "source", "category,source", "none"] = Query(
+        default="category", description="Breakdown within each bucket"
+    ),
+    category: Optional[str] = Query(default=None, description="Only this category"),
+    source: Optional[str] = Query(default=None, description="Only this source host"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Likes and dislikes per time bucket, e.g. likes per category per day.
+    
+    Reads the pre-aggregated feedback rollups, so the cost depends on the
+    number of buckets in the range, not on the size of the feedback table.
+    
+    Args:
+        granularity: "hour" or "day"
+        since: Range start (inclusive)
+        until: Range end (exclusive)
+        group_by: Dimensions to break each bucket down by
+        category: Category filter
+        source: Source host filter
+        db: Database session
+        
+    Returns:
+        FeedbackSeriesResponse with one entry per bucket and group
+    """
+    since, until = _time_range(granularity, since, until)
+    logger.info(f"Feedback series ({granularity}, {since} - {until}, group_by={group_by})")
+    
+    try:
+        dimensions = [] if group_by == "none" else [
+            getattr(FeedbackRollup, name) for name in group_by.split(",")
+        ]
+        query = _rollup_query(granularity, since, until, category, source, FeedbackRollup.bucket, *dimensions)
+        query = query.order_by(FeedbackRollup.bucket, *dimensions)
+        rows = (await db.execute(query)).all()
+        
+        return FeedbackSeriesResponse(
+            granularity=granularity,
+            since=since,
+            until=until,
+            buckets=[FeedbackBucket(**row._mapping) for row in rows]
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to read feedback series: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to read feedback analytics.")
+
+@router.get("/feedback/totals", response_model=FeedbackTotalsResponse)
+async def get_feedback_totals(
+    dimension: Literal["category", "source"] = Query(default="source", description="Group totals by this"),
+    sort: Literal["dislikes", "likes", "votes", "dislike_ratio"] = Query(default="dislikes"),
+    min_votes: int = Query(default=1, ge=1, description="Hide groups with fewer votes"),
+    since: Optional[datetime] = Query(default=None, description="Start of the range (default: 30 days back)"),
+    until: Optional[datetime] = Query(default=None, description="End of the range (default: now)"),
+    limit: int = Query(default=50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Feedback totals per category or source, e.g. which sources get disliked.
+    
+    Summed from the daily rollups.
+    
+    Args:
+        dimension: "category" or "source"
+        sort: Ranking field, highest first
+        min_votes: Minimum likes + dislikes for a group to be listed
+        since: Range start (inclusive)
+        until: Range end (exclusive)
+        limit: Maximum number of groups
+        db: Database session
+        
+    Returns:
+        FeedbackTotalsResponse with one entry per group
+    """
+    since, until = _time_range("day", since, until)
+    logger.info(f"Feedback totals by {dimension} ({since} - {until}, sort={sort})")
+    
+    try:
+        key = getattr(FeedbackRollup, dimension)
+        query = _rollup_query("day", since, until, None, None, key)
+        rows = (await db.execute(query)).all()
+        
+        totals = []
+        for row in rows:
+            votes = row.likes + row.dislikes
+            if votes >= min_votes:
+                totals.append(FeedbackTotal(
+                    key=row[0],
+                    likes=row.likes,
+                    dislikes=row.dislikes,
+                    votes=votes,
+                    dislike_ratio=round(row.dislikes / votes, 4)
+                ))
+        totals.sort(key=lambda total: getattr(total, sort), reverse=True)
+        
+        return FeedbackTotalsResponse(dimension=dimension, since=since, until=until, totals=totals[:limit])
+        
+    except Exception as e:
+        logger.error(f"Failed to read feedback totals: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to read feedback analytics.")
+
+def _time_range(granularity: str, since: Optional[datetime], until: Optional[datetime]) -> Tuple[datetime, datetime]:
+    """Normalize to naive UTC and align `since` to its bucket so partial buckets are included."""
+    until = _to_utc(until) if until else datetime.utcnow()
+    since = _to_utc(since) if since else until - DEFAULT_RANGE[granularity]
+    if since >= until:
+        raise HTTPException(status_code=400, detail="`since` must be before `until`.")
+    return GRANULARITIES[granularity](since), until
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _rollup_query(granularity: str, since: datetime, until: datetime,
+                  category: Optional[str], source: Optional[str], *columns):
+    query = (
+        select(*columns,
+               func.sum(FeedbackRollup.likes).label("likes"),
+               func.sum(FeedbackRollup.dislikes).label("dislikes"))
+        .where(FeedbackRollup.granularity == granularity,
+               FeedbackRollup.bucket >= since,
+               FeedbackRollup.bucket < until)
+        .group_by(*columns)
+    )
+    if category:
+        query = query.where(FeedbackRollup.category == category)
+    if source:
+        query = query.where(FeedbackRollup.source == source)
+    return query
@@ -1,12 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from datetime import datetime
-from typing import List
-
-from schemas.article import StoreArticleRequest, StoreArticleResponse, ArticleResponse
-from models.article import Article
-from models.database import get_db
+import base64
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, func, or_, select
+from datetime import datetime, timezone
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from schemas.article import (
+    StoreArticleRequest, StoreArticleResponse, StoreArticleBatchRequest, StoreArticleBatchResponse, ArticleResponse,
+    ArchivedArticleResponse, ArticleFacetsResponse
+)
+from models.article import Article, ArticleRating
+from models.database import get_async_db
+from services.article_store import article_store
+from services.article_export import article_exporter
+from services.retention import archive_search
+from services.facets import facet_cache
+from services.write_queue import group_writer, WriteQueueFull
+from core.config import settings
+from core.responses import FastJSONResponse
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -14,13 +27,15 @@ logger = get_logger(__name__)
 router = APIRouter(tags=["articles"])
 
 @router.post("/store", response_model=StoreArticleResponse)
-def store_article(request: StoreArticleRequest, db: Session = Depends(get_db)):
+async def store_article(request: StoreArticleRequest):
     """
     Store an article in the database.
     
+    Articles are keyed by their normalized source URL: storing a URL that is
+    already present updates that article instead of adding a duplicate.
+    
     Args:
         request: StoreArticleRequest containing article data
-        db: Database session
         
     Returns:
         StoreArticleResponse with stored article ID and timestamp
@@ -28,55 +43,346 @@ def store_article(request: StoreArticleRequest, db: Session = Depends(get_db)):
     logger.info(f"Storing article: {request.title}")
     
     try:
-        article = Article(
-            title=request.title,
-            summary=request.summary,
-            category=request.category,
-            source_url=request.source_url,
-            timestamp=request.timestamp or datetime.utcnow()
-        )
-        
-        db.add(article)
-        db.commit()
-        db.refresh(article)
+        [(article_id, timestamp)] = await group_writer.submit(article_store.upsert_many, [request.model_dump()])
+        facet_cache.invalidate()
         
-        logger.info(f"Article stored successfully with ID: {article.id}")
-        return StoreArticleResponse(id=article.id, timestamp=article.timestamp)
+        logger.info(f"Article stored successfully with ID: {article_id}")
+        return StoreArticleResponse(id=article_id, timestamp=timestamp)
         
+    except WriteQueueFull:
+        raise
     except Exception as e:
-        db.rollback()
         logger.error(f"Failed to store article: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to store article.")
 
+@router.post("/store/batch", response_model=StoreArticleBatchResponse)
+async def store_articles(request: StoreArticleBatchRequest):
+    """
+    Store many articles in one transaction.
+    
+    Rows are written with chunked bulk upserts keyed on the normalized source
+    URL, like POST /store, as a single operation on the group-commit writer;
+    either every article is stored or none is.
+    
+    Args:
+        request: StoreArticleBatchRequest with the articles to store
+        
+    Returns:
+        StoreArticleBatchResponse with the stored IDs and timestamps in request order
+        
+    Raises:
+        HTTPException: 413 if the batch exceeds STORE_BATCH_MAX_ITEMS
+    """
+    if len(request.articles) > settings.store_batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.store_batch_max_items} articles can be stored per request."
+        )
+    
+    logger.info(f"Storing batch of {len(request.articles)} articles")
+    
+    try:
+        rows = [article.model_dump() for article in request.articles]
+        stored = await group_writer.submit(article_store.upsert_many, rows)
+        facet_cache.invalidate()
+        
+        logger.info(f"Stored {len(stored)} articles")
+        return StoreArticleBatchResponse(
+            articles=[StoreArticleResponse(id=article_id, timestamp=timestamp) for article_id, timestamp in stored]
+        )
+        
+    except WriteQueueFull:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to store article batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to store articles.")
+
+# Columns of an ArticleResponse, in the order article_item() reads them
+ARTICLE_COLUMNS = (
+    Article.id, Article.title, Article.summary, Article.category, Article.source_url, Article.timestamp,
+    func.coalesce(ArticleRating.likes, 0), func.coalesce(ArticleRating.dislikes, 0),
+    func.coalesce(ArticleRating.score, 0.0)
+)
+
 @router.get("/articles", response_model=List[ArticleResponse])
-def get_articles(db: Session = Depends(get_db)):
+async def get_articles(
+    limit: int = Query(default=50, ge=1, le=200, description="Number of articles to return"),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from the X-Next-Cursor header"),
+    category: Optional[str] = Query(default=None, description="Only articles in this category"),
+    source: Optional[str] = Query(default=None, description="Only articles from this publisher host, as listed by /articles/facets"),
+    source_url_prefix: Optional[str] = Query(default=None, description="Only articles whose source_url starts with this prefix"),
+    since: Optional[datetime] = Query(default=None, description="Only articles at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only articles before this time"),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Get all articles from the database, ordered by most recent first.
+    Get stored articles, most recent first, one page at a time.
+    
+    Pages are keyset-paginated on (timestamp, id): when more results exist the
+    response carries an X-Next-Cursor header (and a Link rel="next" header)
+    to pass back as `cursor` for the following page.
     
     Args:
+        limit: Maximum number of articles to return (1-200)
+        cursor: Cursor from the previous page
+        category: Category filter
+        source: Publisher host filter
+        source_url_prefix: Source URL prefix filter
+        since: Lower time bound (inclusive)
+        until: Upper time bound (exclusive)
         db: Database session
         
     Returns:
-        List of ArticleResponse objects
+        List of ArticleResponse objects, serialized directly from the rows
     """
-    logger.info("Retrieving all articles")
+    logger.info(f"Retrieving articles (limit={limit}, cursor={cursor}, category={category}, source={source}, source_url_prefix={source_url_prefix})")
+    
+    position = _decode_cursor(cursor) if cursor else None
     
     try:
-        articles = db.query(Article).order_by(desc(Article.timestamp)).all()
-        logger.info(f"Retrieved {len(articles)} articles")
-        
-        return [
-            ArticleResponse(
-                id=a.id,
-                title=a.title,
-                summary=a.summary,
-                category=a.category,
-                source_url=a.source_url,
-                timestamp=a.timestamp.isoformat()
+        query = select(*ARTICLE_COLUMNS).outerjoin(ArticleRating, ArticleRating.article_id == Article.id)
+        if category:
+            query = query.where(Article.category == category)
+        if source:
+            query = query.where(Article.source == source)
+        if source_url_prefix:
+            # A half-open range instead of LIKE 'prefix%' so ix_articles_source_url applies
+            query = query.where(Article.source_url >= source_url_prefix,
+                                Article.source_url < _prefix_upper_bound(source_url_prefix))
+        if since:
+            query = query.where(Article.timestamp >= _to_utc(since))
+        if until:
+            query = query.where(Article.timestamp < _to_utc(until))
+        if position:
+            timestamp, article_id = position
+            # Equivalent to (timestamp, id) < (cursor), written so the bound on
+            # timestamp alone lets SQLite seek into the index
+            query = query.where(
+                Article.timestamp <= timestamp,
+                or_(Article.timestamp < timestamp, Article.id < article_id)
             )
-            for a in articles
-        ]
+        
+        # Fetch one extra row to know whether another page exists
+        query = query.order_by(desc(Article.timestamp), desc(Article.id)).limit(limit + 1)
+        rows = (await db.execute(query)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        logger.info(f"Retrieved {len(rows)} articles")
+        
+        response = FastJSONResponse([article_item(row) for row in rows])
+        if has_more:
+            last = rows[-1]
+            next_cursor = _encode_cursor(last.timestamp, last.id)
+            response.headers["X-Next-Cursor"] = next_cursor
+            response.headers["Link"] = f'</articles?{urlencode(_next_params(next_cursor, limit, category, source, source_url_prefix, since, until))}>; rel="next"'
+        return response
         
     except Exception as e:
         logger.error(f"Failed to retrieve articles: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve articles.") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to retrieve articles.")
+
+@router.get("/articles/top", response_model=List[ArticleResponse])
+async def get_top_articles(
+    limit: int = Query(default=20, ge=1, le=100, description="Number of articles to return"),
+    category: Optional[str] = Query(default=None, description="Only articles in this category"),
+    min_votes: int = Query(default=1, ge=1, description="Minimum likes + dislikes to be ranked"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the best-rated articles.
+    
+    Articles are ranked by the lower bound of the Wilson score interval of
+    their like ratio, which favours well-supported ratings over a handful of
+    votes. Scores are read from the materialized article_ratings counters.
+    
+    Args:
+        limit: Maximum number of articles to return (1-100)
+        category: Category filter
+        min_votes: Minimum number of votes
+        db: Database session
+        
+    Returns:
+        List of ArticleResponse objects, highest score first
+    """
+    logger.info(f"Retrieving top articles (limit={limit}, category={category}, min_votes={min_votes})")
+    
+    try:
+        query = (
+            select(*ARTICLE_COLUMNS)
+            .join(ArticleRating, ArticleRating.article_id == Article.id)
+            .where(ArticleRating.likes + ArticleRating.dislikes >= min_votes)
+        )
+        if category:
+            query = query.where(Article.category == category)
+        query = query.order_by(desc(ArticleRating.score), desc(ArticleRating.article_id)).limit(limit)
+        
+        rows = (await db.execute(query)).all()
+        logger.info(f"Retrieved {len(rows)} top articles")
+        return FastJSONResponse([article_item(row) for row in rows])
+        
+    except Exception as e:
+        logger.error(f"Failed to retrieve top articles: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve top articles.")
+
+@router.get("/articles/facets", response_model=ArticleFacetsResponse)
+async def get_article_facets(
+    source_limit: int = Query(default=50, ge=1, le=1000, description="Number of sources to return"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get article counts per category and per source for filter menus.
+    
+    Counts come from the trigger-maintained article_facets table and are
+    cached in memory until the next store or delete, so the cost is
+    proportional to the number of categories and sources, not articles.
+    
+    Args:
+        source_limit: Maximum number of sources, most articles first
+        db: Database session
+        
+    Returns:
+        ArticleFacetsResponse with the total and per-value counts
+    """
+    try:
+        facets = await facet_cache.get(db)
+        categories = facets["category"]
+        return ArticleFacetsResponse(
+            total=sum(facet["count"] for facet in categories),
+            categories=categories,
+            sources=facets["source"][:source_limit]
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to retrieve article facets: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve article facets.")
+
+@router.get("/articles/archive", response_model=List[ArchivedArticleResponse])
+def search_archived_articles(
+    q: Optional[str] = Query(default=None, min_length=2, description="Text to find in the title or summary"),
+    category: Optional[str] = Query(default=None, description="Only articles in this category"),
+    since: Optional[datetime] = Query(default=None, description="Only articles at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only articles before this time"),
+    limit: int = Query(default=50, ge=1, le=200, description="Number of articles to return")
+):
+    """
+    Search articles that the retention job moved out of the database.
+    
+    Scans the monthly gzip archives on demand (newest month first), reading
+    only the months inside [since, until), so narrow time ranges are fast and
+    open-ended text searches read every archive.
+    
+    Args:
+        q: Case-insensitive text filter
+        category: Category filter
+        since: Lower time bound (inclusive)
+        until: Upper time bound (exclusive)
+        limit: Maximum number of articles to return (1-200)
+        
+    Returns:
+        List of ArchivedArticleResponse objects
+    """
+    logger.info(f"Searching archived articles (q={q}, category={category}, since={since}, until={until})")
+    
+    try:
+        results = archive_search.search(
+            query=q,
+            category=category,
+            since=_to_utc(since) if since else None,
+            until=_to_utc(until) if until else None,
+            limit=limit
+        )
+        logger.info(f"Found {len(results)} archived articles")
+        return results
+        
+    except Exception as e:
+        logger.error(f"Failed to search archived articles: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to search archived articles.")
+
+# Media type and file extension per export format
+EXPORT_FORMATS = {"ndjson": ("application/x-ndjson", "ndjson"), "csv": ("text/csv; charset=utf-8", "csv")}
+
+@router.get(
+    "/articles/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}}
+)
+async def export_articles(
+    fmt: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format", description="ndjson or csv"),
+    gzip: bool = Query(default=False, description="Gzip the response body (Content-Encoding: gzip)"),
+    category: Optional[str] = Query(default=None, description="Only articles in this category"),
+    since: Optional[datetime] = Query(default=None, description="Only articles at or after this time"),
+    until: Optional[datetime] = Query(default=None, description="Only articles before this time"),
+):
+    """
+    Export stored articles in id order as NDJSON (one object per line) or CSV.
+    
+    The body is streamed from a server-side cursor EXPORT_BATCH_SIZE rows at a
+    time, so the whole table can be exported without loading it into memory.
+    Each item carries the ArticleResponse fields plus `source`.
+    
+    Args:
+        fmt: Output format ("format" query parameter)
+        gzip: Compress the stream on the fly
+        category: Category filter
+        since: Lower time bound (inclusive)
+        until: Upper time bound (exclusive)
+        
+    Returns:
+        StreamingResponse with the export as an attachment
+    """
+    logger.info(f"Exporting articles (format={fmt}, gzip={gzip}, category={category})")
+    
+    query = article_exporter.query(
+        category=category,
+        since=_to_utc(since) if since else None,
+        until=_to_utc(until) if until else None
+    )
+    media_type, extension = EXPORT_FORMATS[fmt]
+    headers = {"Content-Disposition": f'attachment; filename="articles.{extension}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(article_exporter.stream(query, fmt, compress=gzip), media_type=media_type, headers=headers)
+
+def article_item(row: Sequence) -> Dict:
+    """An ArticleResponse-shaped dict from a row selected with ARTICLE_COLUMNS."""
+    article_id, title, summary, category, source_url, timestamp, likes, dislikes, score = row
+    return {
+        "id": article_id,
+        "title": title,
+        "summary": summary,
+        "category": category,
+        "source_url": source_url,
+        "timestamp": timestamp.isoformat(),
+        "likes": likes,
+        "dislikes": dislikes,
+        "score": score
+    }
+
+def _encode_cursor(timestamp: datetime, article_id: int) -> str:
+    raw = f"{timestamp.isoformat()}|{article_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, article_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(article_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def _to_utc(value: datetime) -> datetime:
+    """Timestamps are stored as naive UTC; normalize aware query values to match."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def _next_params(cursor: str, limit: int, category: Optional[str], source: Optional[str],
+                 source_url_prefix: Optional[str], since: Optional[datetime], until: Optional[datetime]) -> dict:
+    params = {"limit": limit, "cursor": cursor, "category": category, "source": source,
+              "source_url_prefix": source_url_prefix,
+              "since": since.isoformat() if since else None, "until": until.isoformat() if until else None}
+    return {key: value for key, value in params.items() if value is not None}
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from schemas.article import FeedbackRequest
-from models.article import Feedback
-from models.database import get_db
+from models.article import Article
+from models.database import get_async_db
+from services.ratings import rating_service
+from services.write_queue import group_writer, WriteQueueFull
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -11,32 +14,39 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
 @router.post("/")
-def post_feedback(request: FeedbackRequest, db: Session = Depends(get_db)):
+async def post_feedback(request: FeedbackRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Record user feedback for an article.
     
+    The vote is stored together with the article's like/dislike counters in
+    one transaction.
+    
     Args:
         request: FeedbackRequest containing article ID and feedback
         db: Database session
         
     Returns:
-        Success message
+        Success message with the article's updated like and dislike counts
+        
+    Raises:
+        HTTPException: 404 if the article does not exist
     """
     logger.info(f"Recording feedback for article {request.article_id}: {request.feedback}")
     
+    if await db.get(Article, request.article_id) is None:
+        raise HTTPException(status_code=404, detail="Article not found.")
+    
     try:
-        feedback = Feedback(
-            article_id=request.article_id,
-            feedback=request.feedback
-        )
-        
-        db.add(feedback)
-        db.commit()
+        likes, dislikes = await group_writer.submit(rating_service.record_vote, request.article_id, request.feedback)
         
         logger.info(f"Feedback stored successfully for article {request.article_id}")
-        return {"status": "success"}
+        return {"status": "success", "likes": likes, "dislikes": dislikes}
         
+    except WriteQueueFull:
+        raise
+    except NoResultFound:
+        # Archived or deleted between the check above and the queued write
+        raise HTTPException(status_code=404, detail="Article not found.")
     except Exception as e:
-        db.rollback()
         logger.error(f"Failed to store feedback: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to store feedback.") 
\ No newline at end of file
@@ -1,14 +1,42 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from typing import Dict, List, Optional
 
-from schemas.article import NewsResponse, NewsArticle, TrendingTopicsResponse
+from schemas.article import NewsResponse, TrendingTopicsResponse
 from services.news_fetcher import news_fetcher
+from core.responses import FastJSONResponse
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+def build_news_response(theme: str, articles_data: List[Dict]) -> Dict:
+    """
+    Convert fetched feed entries into a NewsResponse-shaped dict.
+    
+    Entries are copied field by field into plain dicts that FastJSONResponse
+    encodes as is, without building and re-validating a model per entry.
+    
+    Args:
+        theme: Theme or keyword the entries were selected for
+        articles_data: Entries as returned by NewsFetcher
+        
+    Returns:
+        Dict matching NewsResponse with one NewsArticle-shaped dict per entry
+    """
+    articles = [
+        {
+            'title': article_data.get('title', 'No Title'),
+            'summary': article_data.get('summary', 'No Summary'),
+            'link': article_data.get('link', ''),
+            'published': article_data.get('published', ''),
+            'source': article_data.get('source', 'Unknown'),
+            'source_url': article_data.get('source_url', '')
+        }
+        for article_data in articles_data
+    ]
+    return {'theme': theme, 'articles': articles, 'total_found': len(articles)}
+
 @router.get("/{theme}", response_model=NewsResponse)
 def get_news_by_theme(
     theme: str, 
@@ -36,26 +64,11 @@ def get_news_by_theme(
         # Fetch articles from RSS feeds
         articles_data = news_fetcher.fetch_news_by_theme(theme, limit)
         
-        # Convert to response models
-        articles = []
-        for article_data in articles_data:
-            article = NewsArticle(
-                title=article_data.get('title', 'No Title'),
-                summary=article_data.get('summary', 'No Summary'),
-                link=article_data.get('link', ''),
-                published=article_data.get('published', ''),
-                source=article_data.get('source', 'Unknown'),
-                source_url=article_data.get('source_url', '')
-            )
-            articles.append(article)
+        response = build_news_response(theme, articles_data)
         
-        logger.info(f"Successfully fetched {len(articles)} articles for theme '{theme}'")
+        logger.info(f"Successfully fetched {response['total_found']} articles for theme '{theme}'")
         
-        return NewsResponse(
-            theme=theme,
-            articles=articles,
-            total_found=len(articles)
-        )
+        return FastJSONResponse(response)
         
     except Exception as e:
         logger.error(f"Error fetching news for theme '{theme}': {str(e)}")
@@ -108,26 +121,11 @@ def search_news(
         # Use the same theme filtering but with exact keyword
         articles_data = news_fetcher.fetch_news_by_theme(keyword, limit)
         
-        # Convert to response models
-        articles = []
-        for article_data in articles_data:
-            article = NewsArticle(
-                title=article_data.get('title', 'No Title'),
-                summary=article_data.get('summary', 'No Summary'),
-                link=article_data.get('link', ''),
-                published=article_data.get('published', ''),
-                source=article_data.get('source', 'Unknown'),
-                source_url=article_data.get('source_url', '')
-            )
-            articles.append(article)
+        response = build_news_response(keyword, articles_data)
         
-        logger.info(f"Found {len(articles)} articles for keyword '{keyword}'")
+        logger.info(f"Found {response['total_found']} articles for keyword '{keyword}'")
         
-        return NewsResponse(
-            theme=keyword,
-            articles=articles,
-            total_found=len(articles)
-        )
+        return FastJSONResponse(response)
         
     except Exception as e:
         logger.error(f"Error searching news for keyword '{keyword}': {str(e)}")
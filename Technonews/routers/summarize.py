@@ -1,6 +1,19 @@
-from fastapi import APIRouter
-from schemas.article import SummarizeRequest, SummarizeResponse
+import json
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from schemas.article import (
+    SummarizeRequest, SummarizeResponse, SummarizeBatchRequest, SummarizeBatchResponse, SummarizeJobResponse,
+    LLMStatsResponse, LLMWindowStats
+)
+from models.job import SummarizationJob
+from models.database import get_db
 from services.deepseek import deepseek_service
+from services.jobs import summarization_jobs
+from services.llm_stats import llm_usage_stats, WINDOWS
+from services.rate_limiter import llm_scheduler
+from services.resilience import Deadline
+from core.config import settings
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -11,19 +24,112 @@ router = APIRouter(prefix="/summarize", tags=["summarize"])
 def summarize_article(request: SummarizeRequest):
     """
     Summarize an article and suggest a title and category using DeepSeek LLM.
-    
+
+    With mode "fast" a local extractive summarizer is used instead; with mode
+    "auto" it is used as a fallback when DeepSeek is slow or unavailable.
+
     Args:
-        request: SummarizeRequest containing article text
-        
+        request: SummarizeRequest containing article text and optional mode
+
     Returns:
         SummarizeResponse with generated title, summary, and category
     """
     logger.info("Received article summarization request")
-    
+    deadline = Deadline(settings.summarize_deadline)
+
     try:
-        result = deepseek_service.analyze_article(request.article_text)
+        result = deepseek_service.summarize(request.article_text, request.mode, deadline=deadline)
         logger.info(f"Article summarized successfully: {result['title']}")
         return SummarizeResponse(**result)
     except Exception as e:
         logger.error(f"Article summarization failed: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+@router.post("/batch", response_model=SummarizeBatchResponse)
+def summarize_batch(request: SummarizeBatchRequest):
+    """
+    Summarize and categorize many short articles, packing several into each DeepSeek call.
+
+    Args:
+        request: SummarizeBatchRequest containing the article texts
+
+    Returns:
+        SummarizeBatchResponse with one result per article, in order (null where it failed)
+    """
+    logger.info(f"Received bulk summarization request for {len(request.articles)} articles")
+    deadline = Deadline(settings.summarize_deadline)
+
+    try:
+        results = deepseek_service.analyze_batch(request.articles, deadline=deadline)
+    except RuntimeError as e:
+        logger.error(f"Bulk summarization failed: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
+
+    logger.info(f"Bulk summarization produced {sum(r is not None for r in results)} results")
+    return SummarizeBatchResponse(results=[SummarizeResponse(**r) if r else None for r in results])
+
+@router.get("/stats", response_model=LLMStatsResponse)
+def get_summarize_stats():
+    """
+    Get LLM usage, latency and cost statistics for this process.
+
+    Returns:
+        LLMStatsResponse with per-window percentiles and totals (1m, 5m, 1h, 24h)
+        plus lifetime totals since startup
+    """
+    return LLMStatsResponse(
+        windows=[LLMWindowStats(window=name, **llm_usage_stats.window(seconds)) for name, seconds in WINDOWS.items()],
+        totals=llm_usage_stats.totals(),
+        preprocess_tokens_saved=deepseek_service.preprocess_tokens_saved,
+        scheduler_queue_depth=llm_scheduler.queue_depth
+    )
+
+@router.post("/jobs", response_model=SummarizeJobResponse, status_code=202)
+def create_summarize_job(request: SummarizeRequest, db: Session = Depends(get_db)):
+    """
+    Queue an article for background summarization.
+
+    Args:
+        request: SummarizeRequest containing article text
+        db: Database session
+
+    Returns:
+        SummarizeJobResponse for the new job; poll GET /summarize/jobs/{id} for the result
+    """
+    logger.info("Received asynchronous summarization request")
+
+    try:
+        job = summarization_jobs.enqueue(db, request.article_text)
+        return _job_response(job)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to enqueue summarization job: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to enqueue summarization job.")
+
+@router.get("/jobs/{job_id}", response_model=SummarizeJobResponse)
+def get_summarize_job(job_id: str, db: Session = Depends(get_db)):
+    """
+    Get the status and, once finished, the result of a summarization job.
+
+    Args:
+        job_id: Job id returned by POST /summarize/jobs
+        db: Database session
+
+    Returns:
+        SummarizeJobResponse with current status
+    """
+    job = summarization_jobs.get(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Summarization job not found: {job_id}")
+    return _job_response(job)
+
+def _job_response(job: SummarizationJob) -> SummarizeJobResponse:
+    return SummarizeJobResponse(
+        id=job.id,
+        status=job.status,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        result=SummarizeResponse(**json.loads(job.result)) if job.result else None,
+        error=job.error
+    )
@@ -1,16 +1,59 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Literal, Optional
 from datetime import datetime
 
 class SummarizeRequest(BaseModel):
     """Request model for article summarization."""
     article_text: str
+    mode: Optional[Literal["llm", "fast", "auto"]] = None  # Defaults to SUMMARIZE_MODE
 
 class SummarizeResponse(BaseModel):
     """Response model for article summarization."""
     title: str
     summary: str
     category: str
+    backend: str = "deepseek"  # "deepseek" or "extractive"
+
+class SummarizeBatchRequest(BaseModel):
+    """Request model for bulk article summarization."""
+    articles: list[str] = Field(..., min_length=1, max_length=100)
+
+class SummarizeBatchResponse(BaseModel):
+    """Response model for bulk article summarization; null where an article failed."""
+    results: list[Optional[SummarizeResponse]]
+
+class SummarizeJobResponse(BaseModel):
+    """Response model for an asynchronous summarization job."""
+    id: str
+    status: Literal["pending", "running", "succeeded", "failed"]
+    attempts: int
+    created_at: datetime
+    updated_at: datetime
+    result: Optional[SummarizeResponse] = None
+    error: Optional[str] = None
+
+class LLMWindowStats(BaseModel):
+    """LLM call statistics over one time window."""
+    window: str
+    calls: int
+    errors: int
+    cache_hits: int
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+    latency_ms_p50: Optional[float] = None
+    latency_ms_p95: Optional[float] = None
+    latency_ms_p99: Optional[float] = None
+    by_status: dict[str, int]
+    by_model: dict[str, int]
+    truncated: bool = False  # older calls in the window were evicted from the buffer
+
+class LLMStatsResponse(BaseModel):
+    """Response model for LLM usage, latency and cost statistics."""
+    windows: list[LLMWindowStats]
+    totals: dict[str, float]
+    preprocess_tokens_saved: int
+    scheduler_queue_depth: int
 
 class StoreArticleRequest(BaseModel):
     """Request model for storing an article."""
@@ -25,6 +68,14 @@ class StoreArticleResponse(BaseModel):
     id: int
     timestamp: datetime
 
+class StoreArticleBatchRequest(BaseModel):
+    """Request model for storing many articles at once."""
+    articles: list[StoreArticleRequest] = Field(..., min_length=1)
+
+class StoreArticleBatchResponse(BaseModel):
+    """Response model for bulk storage; ids are in request order."""
+    articles: list[StoreArticleResponse]
+
 class FeedbackRequest(BaseModel):
     """Request model for submitting article feedback."""
     article_id: int
@@ -38,6 +89,34 @@ class ArticleResponse(BaseModel):
     category: str
     source_url: str
     timestamp: str  # ISO format string
+    likes: int = 0
+    dislikes: int = 0
+    score: float = 0.0  # Wilson score lower bound of the like ratio
+
+class ArchivedArticleResponse(BaseModel):
+    """Response model for an article moved to the monthly archives by the retention job."""
+    id: int
+    title: str
+    summary: str
+    category: str
+    source_url: str
+    source: str
+    timestamp: str  # ISO format string
+    likes: int
+    dislikes: int
+    score: float
+    archived_at: str
+
+class FacetCount(BaseModel):
+    """Number of stored articles with one category or source."""
+    value: str
+    count: int
+
+class ArticleFacetsResponse(BaseModel):
+    """Response model for article filter facets."""
+    total: int
+    categories: list[FacetCount]
+    sources: list[FacetCount]
 
 class FeedsResponse(BaseModel):
     """Response model for feeds configuration."""
@@ -61,4 +140,35 @@ class NewsResponse(BaseModel):
 
 class TrendingTopicsResponse(BaseModel):
     """Response model for trending topics."""
-    topics: list[str] 
\ No newline at end of file
+    topics: list[str] 
+
+class FeedbackBucket(BaseModel):
+    """Likes and dislikes in one time bucket; category/source are null when not grouped by them."""
+    bucket: datetime
+    category: Optional[str] = None
+    source: Optional[str] = None
+    likes: int
+    dislikes: int
+
+class FeedbackSeriesResponse(BaseModel):
+    """Response model for a feedback time series read from the rollups."""
+    granularity: Literal["hour", "day"]
+    since: datetime
+    until: datetime
+    buckets: list[FeedbackBucket]
+
+class FeedbackTotal(BaseModel):
+    """Feedback totals for one category or source over a time range."""
+    key: str
+    likes: int
+    dislikes: int
+    votes: int
+    dislike_ratio: float
+
+class FeedbackTotalsResponse(BaseModel):
+    """Response model for per-category or per-source feedback totals."""
+    dimension: Literal["category", "source"]
+    since: datetime
+    until: datetime
+    totals: list[FeedbackTotal]
+
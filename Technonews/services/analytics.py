@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.logging import get_logger
+from models.article import Article, FeedbackRollup
+from models.database import upsert_insert
+
+logger = get_logger(__name__)
+
+# Rollup granularities and how to truncate a timestamp to the start of its bucket
+GRANULARITIES = {
+    "hour": lambda at: at.replace(minute=0, second=0, microsecond=0),
+    "day": lambda at: at.replace(hour=0, minute=0, second=0, microsecond=0),
+}
+
+class FeedbackRollups:
+    """
+    Incrementally maintained like/dislike totals per hour and per day, broken
+    down by article category and source, so analytics queries read a few
+    pre-aggregated rows instead of joining feedback with articles.
+    """
+
+    def __init__(self):
+        self._statements: Dict[str, object] = {}
+
+    def record(self, db: Session, article_id: int, like: int, dislike: int, at: datetime) -> None:
+        """
+        Add one vote to the article's hour and day buckets.
+
+        Runs on the caller's transaction, alongside the Feedback row.
+
+        Args:
+            db: Database session
+            article_id: Article that was rated
+            like: 1 for a like, else 0
+            dislike: 1 for a dislike, else 0
+            at: Time of the vote (UTC)
+        """
+        category, source = db.execute(
+            select(Article.category, Article.source).where(Article.id == article_id)
+        ).one()
+        connection = db.connection()
+        connection.execute(self._upsert_statement(connection.dialect.name), [
+            {"granularity": name, "bucket": truncate(at), "category": category, "source": source,
+             "likes": like, "dislikes": dislike}
+            for name, truncate in GRANULARITIES.items()
+        ])
+
+    def _upsert_statement(self, dialect_name: str):
+        if dialect_name not in self._statements:
+            statement = upsert_insert(dialect_name, FeedbackRollup)
+            self._statements[dialect_name] = statement.on_conflict_do_update(
+                index_elements=[FeedbackRollup.granularity, FeedbackRollup.bucket,
+                                FeedbackRollup.category, FeedbackRollup.source],
+                set_={
+                    "likes": FeedbackRollup.likes + statement.excluded.likes,
+                    "dislikes": FeedbackRollup.dislikes + statement.excluded.dislikes,
+                }
+            )
+        return self._statements[dialect_name]
+
+# Create global rollups instance
+feedback_rollups = FeedbackRollups()
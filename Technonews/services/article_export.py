@@ -0,0 +1,106 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Optional, Sequence
+
+import orjson
+from sqlalchemy import Select, func, select
+
+from core.config import settings
+from core.logging import get_logger
+from models.article import Article, ArticleRating
+from models.database import AsyncSessionLocal
+
+logger = get_logger(__name__)
+
+# Exported fields, in CSV column order
+EXPORT_FIELDS = ("id", "title", "summary", "category", "source_url", "source", "timestamp", "likes", "dislikes", "score")
+
+class ArticleExporter:
+    """
+    Streams the articles table as NDJSON or CSV.
+
+    Rows are read through a server-side cursor `batch_size` at a time and each
+    batch is encoded (and optionally gzip-compressed) into one chunk before
+    the next is fetched, so memory use depends on the batch size, not on the
+    number of articles exported.
+    """
+
+    def __init__(self, batch_size: int, gzip_level: int):
+        self.batch_size = max(1, batch_size)
+        self.gzip_level = gzip_level
+
+    def query(self, category: Optional[str] = None, since: Optional[datetime] = None,
+              until: Optional[datetime] = None) -> Select:
+        """Export query in id order, with the rating counters of each article."""
+        query = (
+            select(Article.id, Article.title, Article.summary, Article.category, Article.source_url,
+                   Article.source, Article.timestamp,
+                   func.coalesce(ArticleRating.likes, 0), func.coalesce(ArticleRating.dislikes, 0),
+                   func.coalesce(ArticleRating.score, 0.0))
+            .outerjoin(ArticleRating, ArticleRating.article_id == Article.id)
+            .order_by(Article.id)
+        )
+        if category:
+            query = query.where(Article.category == category)
+        if since:
+            query = query.where(Article.timestamp >= since)
+        if until:
+            query = query.where(Article.timestamp < until)
+        return query
+
+    async def stream(self, query: Select, fmt: str, compress: bool = False) -> AsyncIterator[bytes]:
+        """
+        Yield the encoded export of `query` chunk by chunk.
+
+        The session is opened here rather than taken from a request dependency
+        because the body is produced after the route function has returned.
+
+        Args:
+            query: Query from `query()`
+            fmt: "ndjson" or "csv"
+            compress: Gzip the stream
+        """
+        encode = self._encode_csv if fmt == "csv" else self._encode_ndjson
+        gzip = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+        exported = 0
+
+        def emit(chunk: bytes) -> bytes:
+            return gzip.compress(chunk) if gzip else chunk
+
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query.execution_options(yield_per=self.batch_size))
+            if fmt == "csv":
+                yield emit(_csv_lines([EXPORT_FIELDS]))
+            async for rows in result.partitions():
+                exported += len(rows)
+                chunk = emit(encode(rows))
+                if chunk:
+                    yield chunk
+
+        if gzip:
+            yield gzip.flush()
+        logger.info(f"Exported {exported} articles as {fmt}{' (gzip)' if compress else ''}")
+
+    @staticmethod
+    def _encode_ndjson(rows: Sequence[Sequence]) -> bytes:
+        lines = []
+        for row in rows:
+            item = dict(zip(EXPORT_FIELDS, row))
+            item["timestamp"] = item["timestamp"].isoformat()
+            lines.append(orjson.dumps(item))
+        lines.append(b"")
+        return b"\n".join(lines)
+
+    @staticmethod
+    def _encode_csv(rows: Sequence[Sequence]) -> bytes:
+        return _csv_lines(row[:6] + (row[6].isoformat(),) + row[7:] for row in map(tuple, rows))
+
+def _csv_lines(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+# Create global exporter instance
+article_exporter = ArticleExporter(batch_size=settings.export_batch_size, gzip_level=settings.export_gzip_level)
@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.logging import get_logger
+from models.article import Article
+from models.database import upsert_insert
+from services.preprocess import normalize_url, url_host
+
+logger = get_logger(__name__)
+
+class ArticleStore:
+    """
+    Bulk writes to the articles table through Core INSERT ... ON CONFLICT
+    ... RETURNING, bypassing per-object ORM flushes and refreshes.
+
+    Articles are keyed by url_key (the normalized source_url): storing a URL
+    that already exists updates that row's title, summary, category and
+    source_url in place, keeping its id and original timestamp.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = max(1, chunk_size)
+        # Built once per dialect; constructing ON CONFLICT clauses is not free
+        self._statements: Dict[str, object] = {}
+
+    def upsert_many(self, db: Session, rows: Iterable[Dict]) -> List[Tuple[int, datetime]]:
+        """
+        Insert or update article rows in chunks on the caller's transaction.
+
+        The caller commits (or rolls back), so a whole request's articles are
+        stored atomically however many chunks it takes. Rows in the same call
+        that share a URL collapse into the last one.
+
+        Args:
+            db: Database session
+            rows: Dicts with title, summary, category, source_url and an
+                optional timestamp (defaults to now)
+
+        Returns:
+            (id, timestamp) for each input row, in input order
+        """
+        now = datetime.utcnow()
+        keys: List[str] = []
+        by_key: Dict[str, Dict] = {}
+        for row in rows:
+            key = normalize_url(row["source_url"])
+            keys.append(key)
+            by_key[key] = {**row, "url_key": key, "source": url_host(key), "timestamp": row.get("timestamp") or now}
+
+        # Execute on the session's connection as plain Core, skipping the ORM bulk-insert layer
+        connection = db.connection()
+        statement = self._upsert_statement(connection.dialect.name)
+        values = list(by_key.values())
+        stored: Dict[str, Tuple[int, datetime]] = {}
+        for start in range(0, len(values), self.chunk_size):
+            for row in connection.execute(statement, values[start:start + self.chunk_size]):
+                stored[row.url_key] = (row.id, row.timestamp)
+
+        logger.debug(f"Upserted {len(values)} articles ({len(keys) - len(values)} duplicates in input)")
+        return [stored[key] for key in keys]
+
+    def _upsert_statement(self, dialect_name: str):
+        if dialect_name in self._statements:
+            return self._statements[dialect_name]
+        statement = upsert_insert(dialect_name, Article)
+        self._statements[dialect_name] = statement.on_conflict_do_update(
+            index_elements=[Article.url_key],
+            set_={
+                "title": statement.excluded.title,
+                "summary": statement.excluded.summary,
+                "category": statement.excluded.category,
+                "source_url": statement.excluded.source_url,
+            }
+        ).returning(Article.id, Article.timestamp, Article.url_key)
+        return self._statements[dialect_name]
+
+# Create global store instance
+article_store = ArticleStore(chunk_size=settings.store_batch_chunk_size)
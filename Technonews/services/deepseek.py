@@ -1,29 +1,180 @@
 import requests
 import json
-from typing import Dict
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait, FIRST_COMPLETED
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Dict, List, Optional
 from fastapi import HTTPException
 from core.config import settings
 from core.logging import get_logger
+from services.extractive import extractive_summarizer
+from services.llm_stats import llm_usage_stats
+from services.preprocess import clean_article_text
+from services.rate_limiter import llm_scheduler, RateLimitTimeout, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from services.resilience import Deadline, LatencyTracker, RetryPolicy, UpstreamError, RETRYABLE_STATUS_CODES
+from services.tokens import estimate_tokens, split_into_chunks
 
 logger = get_logger(__name__)
 
+# Instructions live in stable system messages so the provider can cache the
+# prompt prefix; only the per-call content goes in the user message.
+ANALYZE_SYSTEM_PROMPT = (
+    "You are an expert news assistant. Given an article, generate a concise, engaging title, "
+    "a 2-3 sentence summary, and suggest a category (e.g., politics, technology, health, etc.). "
+    "Return the result as a JSON object with keys: title, summary, category."
+)
+
+MAP_SYSTEM_PROMPT = (
+    "You are an expert news assistant. You will receive one section of a longer article. "
+    "Summarize the section in 3-5 sentences, keeping names, numbers and key facts. "
+    "Return plain text only."
+)
+
+MERGE_SYSTEM_PROMPT = (
+    "You are an expert news assistant. You will receive summaries of consecutive sections of one article. "
+    "Merge them into one summary of 4-6 sentences, keeping names, numbers and key facts. "
+    "Return plain text only."
+)
+
+REDUCE_SYSTEM_PROMPT = (
+    "You are an expert news assistant. You will receive summaries of consecutive sections of one article. "
+    "Based on them, generate a concise, engaging title for the whole article, a 2-3 sentence summary, "
+    "and suggest a category (e.g., politics, technology, health, etc.). "
+    "Return the result as a JSON object with keys: title, summary, category."
+)
+
+BATCH_SYSTEM_PROMPT = (
+    "You are an expert news assistant. You will receive several news articles, each introduced by a line "
+    "'### Article <id>'. For each article generate a concise, engaging title, a 2-3 sentence summary, "
+    "and suggest a category (e.g., politics, technology, health, etc.). "
+    "Return ONLY a JSON array with one object per article, in the same order, "
+    "each with keys: id, title, summary, category."
+)
+
+# Completion budget per packed article (title + 2-3 sentence summary + category)
+BATCH_TOKENS_PER_ITEM = 160
+
 class DeepSeekService:
     """Service for interacting with DeepSeek API for article analysis."""
-    
+
     def __init__(self):
         self.api_key = settings.deepseek_api_key
-        self.api_url = "https://api.deepseek.com/chat/completions"  # Updated URL
-        
-    def analyze_article(self, article_text: str) -> Dict[str, str]:
+        self.api_url = settings.deepseek_api_url
+        self.model = "deepseek-chat"
+        self.max_input_tokens = settings.llm_max_input_tokens
+        self.chunk_tokens = settings.llm_chunk_tokens
+        self.max_chunks = settings.llm_max_chunks
+        self._map_executor = ThreadPoolExecutor(
+            max_workers=settings.llm_map_concurrency,
+            thread_name_prefix="deepseek-map"
+        )
+        self._call_executor = ThreadPoolExecutor(
+            max_workers=settings.llm_call_concurrency,
+            thread_name_prefix="deepseek-call"
+        )
+        # Hedged requests get their own pool: _call_executor workers block in
+        # _send waiting for them, so sharing it would deadlock once it is full
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=2 * settings.llm_call_concurrency,
+            thread_name_prefix="deepseek-hedge"
+        )
+        self._batch_executor = ThreadPoolExecutor(
+            max_workers=settings.llm_map_concurrency,
+            thread_name_prefix="deepseek-batch"
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=settings.llm_max_attempts,
+            base_delay=settings.llm_retry_base_delay,
+            max_delay=settings.llm_retry_max_delay
+        )
+        self._latency = LatencyTracker()
+        self.batch_max_items = settings.llm_batch_max_items
+        self.batch_max_input_tokens = settings.llm_batch_max_input_tokens
+        self.batch_item_max_tokens = settings.llm_batch_item_max_tokens
+        self._stats_lock = threading.Lock()
+        self.preprocessed_articles = 0
+        self.preprocess_tokens_saved = 0
+
+    def summarize(self, article_text: str, mode: Optional[str] = None, priority: int = PRIORITY_INTERACTIVE,
+                  deadline: Optional[Deadline] = None) -> Dict[str, str]:
+        """
+        Summarize an article with the requested backend.
+
+        Modes:
+            llm: always use DeepSeek
+            fast: always use the local extractive summarizer
+            auto: use DeepSeek, falling back to the extractive summarizer when the
+                API key is missing, the upstream fails, or the call exceeds the
+                latency budget
+
+        Args:
+            article_text: Raw article content to analyze
+            mode: One of llm, fast, auto; defaults to SUMMARIZE_MODE
+            priority: Scheduling priority, see services.rate_limiter
+            deadline: Optional deadline for the whole request
+
+        Returns:
+            Dictionary with title, summary, category, and the backend that produced them
+        """
+        mode = mode or settings.summarize_mode
+
+        if mode == "fast":
+            return self._extractive(article_text)
+        if mode == "llm":
+            return {**self.analyze_article(article_text, priority, deadline), "backend": "deepseek"}
+
+        if not self.api_key:
+            logger.warning("DeepSeek API key not set, using extractive summarizer")
+            return self._extractive(article_text)
+
+        budget = settings.llm_latency_budget if deadline is None else deadline.cap(settings.llm_latency_budget)
+        llm_deadline = Deadline(budget)
+        future = self._call_executor.submit(self.analyze_article, article_text, priority, llm_deadline)
+        try:
+            return {**future.result(timeout=budget), "backend": "deepseek"}
+        except FutureTimeoutError:
+            future.cancel()
+            logger.warning(f"DeepSeek exceeded latency budget of {budget:.2f}s, using extractive summarizer")
+        except HTTPException as e:
+            if e.status_code < 500:
+                raise
+            logger.warning(f"DeepSeek unavailable ({e.status_code}), using extractive summarizer")
+        return self._extractive(article_text)
+
+    def _extractive(self, article_text: str) -> Dict[str, str]:
+        cleaned = self._preprocess(article_text)
+        return {**extractive_summarizer.analyze_article(cleaned), "backend": "extractive"}
+
+    def _preprocess(self, article_text: str) -> str:
+        """Strip markup and boilerplate before prompting, recording the input tokens saved."""
+        cleaned = clean_article_text(article_text) or article_text.strip()
+        before, after = estimate_tokens(article_text), estimate_tokens(cleaned)
+
+        with self._stats_lock:
+            self.preprocessed_articles += 1
+            self.preprocess_tokens_saved += before - after
+        logger.info(f"Preprocessing saved ~{before - after} input tokens ({before} -> {after})")
+        return cleaned
+
+    def analyze_article(self, article_text: str, priority: int = PRIORITY_INTERACTIVE,
+                        deadline: Optional[Deadline] = None) -> Dict[str, str]:
         """
         Analyze article text using DeepSeek API to generate title, summary, and category.
-        
+
+        Articles that exceed the input token budget are split into chunks that
+        are summarized in parallel and then merged in a final reduce call.
+
         Args:
             article_text: Raw article content to analyze
-            
+            priority: Scheduling priority, see services.rate_limiter
+            deadline: Optional deadline propagated from the caller
+
         Returns:
             Dictionary with title, summary, and category
-            
+
         Raises:
             HTTPException: If API call fails or response cannot be parsed
         """
@@ -31,77 +182,443 @@ class DeepSeekService:
             logger.critical("DeepSeek API key not set in environment variables.")
             raise RuntimeError("DeepSeek API key not set in environment variables.")
 
-        prompt = (
-            "You are an expert news assistant. Given the following article, generate a concise, engaging title, "
-            "a 2-3 sentence summary, and suggest a category (e.g., politics, technology, health, etc.). "
-            "Return the result as a JSON object with keys: title, summary, category.\n\nArticle:\n" + article_text
-        )
-        
+        return self._analyze(self._preprocess(article_text), priority, deadline)
+
+    def _analyze(self, article_text: str, priority: int, deadline: Optional[Deadline]) -> Dict[str, str]:
+        """Analyze already-preprocessed text, switching to map-reduce when it is too long."""
+        input_tokens = estimate_tokens(article_text)
+        if input_tokens <= self.max_input_tokens:
+            content = self._chat(ANALYZE_SYSTEM_PROMPT, "Article:\n" + article_text, priority=priority, deadline=deadline)
+            return self._parse_result(content)
+
+        logger.info(f"Article has ~{input_tokens} tokens, using map-reduce summarization")
+        return self._map_reduce(article_text, priority, deadline)
+
+    def analyze_batch(self, articles: List[str], priority: int = PRIORITY_BATCH,
+                      deadline: Optional[Deadline] = None) -> List[Optional[Dict[str, str]]]:
+        """
+        Analyze many short articles with as few DeepSeek calls as possible.
+
+        Articles are packed into prompts of up to LLM_BATCH_MAX_ITEMS articles
+        (and LLM_BATCH_MAX_INPUT_TOKENS tokens) that ask for a JSON array of
+        results. Results are validated and mapped back by id; a group whose
+        answer is unusable, or the articles missing from it, are split in half
+        and retried until single articles are analyzed on their own.
+
+        Args:
+            articles: Article texts to analyze
+            priority: Scheduling priority, see services.rate_limiter
+            deadline: Optional deadline propagated from the caller
+
+        Returns:
+            One result per input article, in order; None where analysis failed
+        """
+        if not self.api_key:
+            logger.critical("DeepSeek API key not set in environment variables.")
+            raise RuntimeError("DeepSeek API key not set in environment variables.")
+
+        articles = [self._preprocess(text) for text in articles]
+        results: List[Optional[Dict[str, str]]] = [None] * len(articles)
+        groups = self._pack_batch(articles)
+        logger.info(f"Analyzing {len(articles)} articles in {len(groups)} packed calls")
+
+        def run(group: List[int]) -> None:
+            for index, result in self._analyze_group(group, articles, priority, deadline).items():
+                results[index] = result
+
+        list(self._batch_executor.map(run, groups))
+        return results
+
+    def _pack_batch(self, articles: List[str]) -> List[List[int]]:
+        """Group article indices so each group fits the item and token limits."""
+        groups: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, text in enumerate(articles):
+            tokens = estimate_tokens(text)
+            if tokens > self.batch_item_max_tokens:
+                groups.append([index])
+                continue
+            if current and (len(current) >= self.batch_max_items or current_tokens + tokens > self.batch_max_input_tokens):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def _analyze_group(self, group: List[int], articles: List[str], priority: int,
+                       deadline: Optional[Deadline]) -> Dict[int, Dict[str, str]]:
+        """Analyze one packed group, re-splitting on partial failures."""
+        if deadline is not None and deadline.expired:
+            # Splitting further would only spend rate-limit capacity on calls that cannot be sent
+            logger.warning(f"Deadline exceeded, leaving {len(group)} articles unanalyzed")
+            return {}
+        if len(group) == 1:
+            try:
+                return {group[0]: self._analyze(articles[group[0]], priority, deadline)}
+            except HTTPException as e:
+                logger.warning(f"Failed to analyze article {group[0]}: {e.detail}")
+                return {}
+
+        packed = "\n\n".join(f"### Article {index}\n{articles[index]}" for index in group)
+        try:
+            content = self._chat(BATCH_SYSTEM_PROMPT, packed, max_tokens=BATCH_TOKENS_PER_ITEM * len(group) + 64,
+                                 priority=priority, deadline=deadline)
+            results = self._parse_batch_result(content, set(group))
+        except HTTPException as e:
+            logger.warning(f"Packed call for {len(group)} articles failed ({e.detail}), splitting")
+            results = {}
+
+        missing = [index for index in group if index not in results]
+        if missing:
+            if len(missing) == len(group):
+                middle = len(group) // 2
+                parts = [group[:middle], group[middle:]]
+            else:
+                parts = [missing]
+            for part in parts:
+                results.update(self._analyze_group(part, articles, priority, deadline))
+        return results
+
+    def _parse_batch_result(self, result_text: str, expected_ids: set) -> Dict[int, Dict[str, str]]:
+        """Parse a JSON array answer, keeping only well-formed entries for expected ids."""
+        try:
+            parsed = json.loads(self._strip_code_fence(result_text))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Packed DeepSeek response is not valid JSON: {str(e)}")
+            return {}
+
+        if isinstance(parsed, dict):
+            parsed = next((value for value in parsed.values() if isinstance(value, list)), [])
+
+        results = {}
+        for item in parsed if isinstance(parsed, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if index not in expected_ids or not item.get("title") or not item.get("summary"):
+                continue
+            results[index] = {
+                "title": str(item["title"]),
+                "summary": str(item["summary"]),
+                "category": str(item.get("category") or "Uncategorized")
+            }
+        return results
+
+    def _map_reduce(self, article_text: str, priority: int, deadline: Optional[Deadline]) -> Dict[str, str]:
+        """
+        Summarize an oversized article chunk by chunk, then merge the partial summaries.
+
+        Chunks grow beyond LLM_CHUNK_TOKENS so the map phase stays within
+        LLM_MAX_CHUNKS calls, up to the LLM_MAX_INPUT_TOKENS limit of one call;
+        only articles larger than that fan out further. Partial summaries that
+        do not fit one reduce call are merged in rounds first, so no part of
+        the article is dropped.
+        """
+        chunk_tokens = min(max(self.chunk_tokens, math.ceil(estimate_tokens(article_text) / self.max_chunks)),
+                           self.max_input_tokens)
+        chunks = split_into_chunks(article_text, chunk_tokens)
+        if len(chunks) > self.max_chunks:
+            logger.warning(f"Article needs {len(chunks)} chunks of {chunk_tokens} tokens, above LLM_MAX_CHUNKS")
+
+        total = len(chunks)
+        sections = [f"Section {i + 1} of {total}:\n{chunk}" for i, chunk in enumerate(chunks)]
+        partials = list(self._map_executor.map(
+            partial(self._chat, MAP_SYSTEM_PROMPT, priority=priority, deadline=deadline), sections
+        ))
+        summaries = [f"Section {i + 1}: {text.strip()}" for i, text in enumerate(partials)]
+        logger.info(f"Summarized {total} chunks, running reduce step")
+
+        while len(summaries) > 1 and estimate_tokens("\n\n".join(summaries)) > self.max_input_tokens:
+            groups = self._pack_summaries(summaries)
+            logger.info(f"Merging {len(summaries)} section summaries in {len(groups)} calls")
+            merged = self._map_executor.map(
+                partial(self._chat, MERGE_SYSTEM_PROMPT, priority=priority, deadline=deadline),
+                ["Section summaries:\n" + "\n\n".join(group) for group in groups]
+            )
+            summaries = [f"Part {i + 1}: {text.strip()}" for i, text in enumerate(merged)]
+
+        combined = "\n\n".join(summaries)
+        content = self._chat(REDUCE_SYSTEM_PROMPT, "Section summaries:\n" + combined, priority=priority, deadline=deadline)
+        return self._parse_result(content)
+
+    def _pack_summaries(self, summaries: List[str]) -> List[List[str]]:
+        """Group consecutive summaries up to the input limit, at least two per group so each round shrinks."""
+        groups: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            if len(current) >= 2 and current_tokens + tokens > self.max_input_tokens:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(summary)
+            current_tokens += tokens
+        if len(current) == 1 and groups:
+            groups[-1].append(current[0])
+        elif current:
+            groups.append(current)
+        return groups
+
+    def _chat(self, system_prompt: str, user_prompt: str, max_tokens: int = 512,
+              priority: int = PRIORITY_INTERACTIVE, deadline: Optional[Deadline] = None) -> str:
+        """
+        Send a single-turn chat completion request and return the message content.
+
+        Retryable failures (timeouts, connection errors, 429 and 5xx) are retried
+        with jittered exponential backoff; a 429 pauses the shared scheduler for
+        the advertised Retry-After. No attempt is started that could not finish
+        before the deadline.
+
+        Args:
+            system_prompt: Static instructions, sent as the system message
+            user_prompt: Per-call content, sent as the user message
+            max_tokens: Maximum completion tokens
+            priority: Scheduling priority, see services.rate_limiter
+            deadline: Optional deadline propagated from the caller
+
+        Returns:
+            Raw message content returned by the model
+
+        Raises:
+            HTTPException: If the API call fails or returns an unexpected body
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        estimated_tokens = estimate_tokens(system_prompt) + estimate_tokens(user_prompt) + max_tokens
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response_data = self._attempt(messages, max_tokens, priority, estimated_tokens, deadline)
+                break
+            except UpstreamError as e:
+                if not e.retryable or attempt >= self.retry_policy.max_attempts:
+                    raise
+
+                delay = e.retry_after if e.retry_after is not None else self.retry_policy.backoff(attempt)
+                expected = self._latency.percentile(50) or 0.0
+                if deadline is not None and deadline.remaining() < delay + expected:
+                    logger.warning(f"Not retrying DeepSeek call, {deadline.remaining():.2f}s left before deadline")
+                    raise
+
+                logger.warning(f"DeepSeek call failed with {e.status_code} (attempt {attempt}), retrying in {delay:.2f}s")
+                if e.retry_after is not None:
+                    llm_scheduler.pause(delay)
+                else:
+                    time.sleep(delay)
+
+        usage = response_data.get('usage') or {}
+        if 'total_tokens' in usage:
+            llm_scheduler.settle(estimated_tokens, usage['total_tokens'])
+        return response_data['choices'][0]['message']['content']
+
+    def _attempt(self, messages: List[dict], max_tokens: int, priority: int, estimated_tokens: int,
+                 deadline: Optional[Deadline]) -> dict:
+        """Run one admitted (and possibly hedged) attempt and return the decoded response body."""
+        if deadline is not None and deadline.expired:
+            # Checked before acquiring, so an expired call never consumes RPM/TPM capacity
+            raise UpstreamError(
+                status_code=504,
+                detail="Request deadline exceeded before DeepSeek could be called."
+            )
+        queue_timeout = settings.llm_queue_timeout if deadline is None else deadline.cap(settings.llm_queue_timeout)
+        try:
+            llm_scheduler.acquire(estimated_tokens, priority=priority, timeout=queue_timeout)
+        except RateLimitTimeout:
+            logger.error("Timed out waiting for DeepSeek rate limit capacity")
+            raise UpstreamError(
+                status_code=503,
+                detail="Summarization capacity exhausted. Please try again later."
+            )
+
+        response = self._send(messages, max_tokens, priority, estimated_tokens, deadline)
+
+        if response.status_code == 429:
+            retry_after = self._retry_after_seconds(response)
+            logger.warning(f"DeepSeek rate limited, Retry-After {retry_after:.1f}s")
+            raise UpstreamError(
+                status_code=503,
+                detail="DeepSeek API rate limit exceeded. Please try again later.",
+                retryable=True,
+                retry_after=retry_after,
+                headers={"Retry-After": str(int(retry_after) + 1)}
+            )
+
+        if response.status_code != 200:
+            logger.error(f"DeepSeek API error: {response.text}")
+            raise UpstreamError(
+                status_code=502,
+                detail=f"DeepSeek API error: {response.text}",
+                retryable=response.status_code in RETRYABLE_STATUS_CODES
+            )
+
+        try:
+            response_data = response.json()
+            logger.debug(f"Full DeepSeek response: {response_data}")
+            response_data['choices'][0]['message']['content']
+            return response_data
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.error(f"Unexpected DeepSeek response body: {response.text}, error: {str(e)}")
+            raise UpstreamError(
+                status_code=502,
+                detail=f"Unexpected DeepSeek response body. Error: {str(e)}"
+            )
+
+    def _send(self, messages: List[dict], max_tokens: int, priority: int, estimated_tokens: int,
+              deadline: Optional[Deadline]) -> requests.Response:
+        """
+        Send the request, optionally hedged: if it has not answered within the
+        recent p95 latency, a second identical request is sent (when the rate
+        limiter has spare capacity) and the first 200 response wins; an error
+        from one is only returned once the other has failed too.
+        """
+        hedge_after = self._latency.percentile(settings.llm_hedge_percentile) if settings.llm_hedging_enabled else None
+        if hedge_after is None:
+            return self._post(messages, max_tokens, deadline)
+
+        primary = self._hedge_executor.submit(self._post, messages, max_tokens, deadline)
+        done, _ = wait([primary], timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        try:
+            llm_scheduler.acquire(estimated_tokens, priority=priority, timeout=0)
+        except RateLimitTimeout:
+            return primary.result()
+
+        logger.info(f"DeepSeek call slower than {hedge_after:.2f}s, sending hedged request")
+        hedge = self._hedge_executor.submit(self._post, messages, max_tokens, deadline)
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, timeout=deadline.remaining() if deadline is not None else None,
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                raise UpstreamError(status_code=504, detail="Request deadline exceeded waiting for DeepSeek.")
+            for future in done:
+                if future.exception() is None and future.result().status_code == 200:
+                    return future.result()
+            if not pending:
+                return done.pop().result()
+
+    def _post(self, messages: List[dict], max_tokens: int, deadline: Optional[Deadline] = None) -> requests.Response:
+        """Perform the HTTP request, mapping transport errors to HTTP exceptions."""
+        timeout = settings.llm_request_timeout if deadline is None else deadline.cap(settings.llm_request_timeout)
+        if timeout <= 0:
+            raise UpstreamError(
+                status_code=504,
+                detail="Request deadline exceeded before DeepSeek could be called."
+            )
+
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
-        
+
         payload = {
-            "model": "deepseek-chat",
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
+            "model": self.model,
+            "messages": messages,
             "temperature": 0.7,
-            "max_tokens": 512
+            "max_tokens": max_tokens
         }
-        
+
+        started = time.monotonic()
         try:
             logger.info("Calling DeepSeek API for article analysis")
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=30)
-            logger.info(f"DeepSeek API response status: {response.status_code}")
+            response = requests.post(self.api_url, headers=headers, json=payload, timeout=timeout)
+            latency = time.monotonic() - started
+            # Fast 429/5xx answers would drag the hedging percentile down
+            if response.status_code == 200:
+                self._latency.record(latency)
+            logger.info(f"DeepSeek API response status: {response.status_code} in {latency * 1000:.0f}ms")
         except requests.exceptions.Timeout:
+            llm_usage_stats.record(self.model, "timeout", time.monotonic() - started)
             logger.error("DeepSeek API request timed out")
-            raise HTTPException(
-                status_code=504, 
-                detail="DeepSeek API request timed out. Please try again later."
+            raise UpstreamError(
+                status_code=504,
+                detail="DeepSeek API request timed out. Please try again later.",
+                retryable=True
             )
         except requests.exceptions.RequestException as e:
+            llm_usage_stats.record(self.model, "error", time.monotonic() - started)
             logger.error(f"DeepSeek API request failed: {str(e)}")
-            raise HTTPException(
-                status_code=502, 
-                detail=f"DeepSeek API request failed: {str(e)}"
-            )
-        
-        if response.status_code != 200:
-            logger.error(f"DeepSeek API error: {response.text}")
-            raise HTTPException(
-                status_code=502, 
-                detail=f"DeepSeek API error: {response.text}"
+            raise UpstreamError(
+                status_code=502,
+                detail=f"DeepSeek API request failed: {str(e)}",
+                retryable=True
             )
-        
+
+        usage = None
+        if response.status_code == 200:
+            try:
+                usage = response.json().get('usage')
+            except (ValueError, AttributeError):
+                pass
+        llm_usage_stats.record(self.model, str(response.status_code), latency, usage)
+        return response
+
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response) -> float:
+        """Read Retry-After (delta-seconds or HTTP date), falling back to the configured default."""
+        value: Optional[str] = response.headers.get("Retry-After")
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return settings.llm_default_retry_after
+
+    def _parse_result(self, result_text: str) -> Dict[str, str]:
+        """
+        Parse the model's JSON answer into title, summary and category.
+
+        Args:
+            result_text: Message content returned by the model
+
+        Returns:
+            Dictionary with title, summary, and category
+
+        Raises:
+            HTTPException: If the content is not valid JSON
+        """
+        logger.debug(f"DeepSeek content: {result_text}")
+
         try:
-            response_data = response.json()
-            logger.info(f"Full DeepSeek response: {response_data}")
-            
-            result_text = response_data['choices'][0]['message']['content']
-            logger.info(f"DeepSeek content: {result_text}")
-            
-            # Clean up markdown code blocks if present
-            if result_text.startswith('```json'):
-                result_text = result_text.replace('```json', '').replace('```', '').strip()
-            elif result_text.startswith('```'):
-                result_text = result_text.replace('```', '').strip()
-            
-            result = json.loads(result_text)
-            logger.info(f"Parsed result: {result}")
-            
+            result = json.loads(self._strip_code_fence(result_text))
+            logger.debug(f"Parsed result: {result}")
+
             return {
                 "title": result.get("title", ""),
                 "summary": result.get("summary", ""),
                 "category": result.get("category", "Uncategorized")
             }
-        except (KeyError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to parse DeepSeek response. Full response: {response.text}, error: {str(e)}")
+        except (AttributeError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to parse DeepSeek response. Content: {result_text}, error: {str(e)}")
             raise HTTPException(
-                status_code=500, 
+                status_code=500,
                 detail=f"Failed to parse DeepSeek response as JSON. The model may have returned unexpected output. Error: {str(e)}"
             )
 
+    @staticmethod
+    def _strip_code_fence(result_text: str) -> str:
+        """Clean up markdown code blocks if present."""
+        result_text = result_text.strip()
+        if result_text.startswith('```json'):
+            return result_text.replace('```json', '').replace('```', '').strip()
+        if result_text.startswith('```'):
+            return result_text.replace('```', '').strip()
+        return result_text
+
 # Create global service instance
-deepseek_service = DeepSeekService() 
\ No newline at end of file
+deepseek_service = DeepSeekService()
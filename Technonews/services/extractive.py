@@ -0,0 +1,150 @@
+import re
+from typing import Dict, List
+
+import numpy as np
+
+from core.config import settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'])')
+_WORD = re.compile(r"[a-z][a-z0-9'-]+")
+
+STOPWORDS = frozenset("""
+an as at be by do he if in is it me my no of on or so to up us we
+about above after again against all also among and any are because been before being below between both
+but can could did does doing down during each few for from further had has have having her here hers herself
+him himself his how into its itself just more most much must not now off once only other our ours ourselves
+out over own same she should some such than that the their theirs them themselves then there these they this
+those through too under until very was were what when where which while who whom why will with would you your
+yours yourself yourselves said says new one two year years
+""".split())
+
+CATEGORY_KEYWORDS = {
+    "technology": ["software", "hardware", "app", "apple", "google", "microsoft", "chip", "startup", "cloud",
+                   "smartphone", "computer", "internet", "tech", "device", "developer", "cybersecurity"],
+    "artificial intelligence": ["ai", "artificial", "intelligence", "machine", "learning", "neural", "model",
+                                "openai", "chatgpt", "llm", "deepseek", "anthropic", "gpt"],
+    "business": ["market", "shares", "stock", "revenue", "profit", "earnings", "investors", "funding",
+                 "acquisition", "company", "billion", "economy", "ceo"],
+    "politics": ["government", "election", "president", "senate", "congress", "minister", "policy", "vote",
+                 "law", "regulation", "parliament", "court"],
+    "health": ["health", "medical", "medicine", "hospital", "patients", "disease", "vaccine", "doctors",
+               "treatment", "drug", "clinical"],
+    "science": ["research", "scientists", "study", "space", "nasa", "physics", "climate", "energy",
+                "researchers", "universe", "quantum"],
+    "crypto": ["bitcoin", "crypto", "cryptocurrency", "blockchain", "ethereum", "token", "coin", "defi"],
+    "automotive": ["tesla", "car", "cars", "vehicle", "vehicles", "electric", "battery", "autonomous",
+                   "driving", "ev"],
+}
+
+class ExtractiveSummarizer:
+    """
+    Local extractive summarizer used as a fast path and as a fallback when the
+    LLM is slow or unavailable.
+
+    Sentences are embedded as TF-IDF vectors and ranked with TextRank (PageRank
+    over the cosine-similarity graph). The top sentences, in their original
+    order, form the summary. Only the first `max_sentences` are ranked, since
+    the similarity graph grows with the square of the sentence count; the
+    category still uses every sentence.
+    """
+
+    def __init__(self, summary_sentences: int = 3, damping: float = 0.85, iterations: int = 30,
+                 max_sentences: int = 200):
+        self.summary_sentences = summary_sentences
+        self.max_sentences = max(1, max_sentences)
+        self.damping = damping
+        self.iterations = iterations
+
+    def analyze_article(self, article_text: str) -> Dict[str, str]:
+        """
+        Produce a title, summary and category without calling an external service.
+
+        Args:
+            article_text: Article content to analyze
+
+        Returns:
+            Dictionary with title, summary, and category
+        """
+        sentences = self._split_sentences(article_text)
+        if not sentences:
+            return {"title": "", "summary": "", "category": "Uncategorized"}
+
+        tokens = [_WORD.findall(s.lower()) for s in sentences]
+        tokens = [[t for t in words if t not in STOPWORDS] for words in tokens]
+
+        scores = self._rank(tokens[:self.max_sentences])
+        top = sorted(np.argsort(-scores, kind="stable")[:self.summary_sentences])
+
+        return {
+            "title": self._make_title(sentences[int(np.argmax(scores))]),
+            "summary": " ".join(sentences[i] for i in top),
+            "category": self._categorize([t for words in tokens for t in words])
+        }
+
+    def _rank(self, tokens: List[List[str]]) -> np.ndarray:
+        n = len(tokens)
+        if n == 1:
+            return np.ones(1)
+
+        vocabulary = {}
+        for words in tokens:
+            for word in words:
+                vocabulary.setdefault(word, len(vocabulary))
+        if not vocabulary:
+            return np.ones(n)
+
+        tf = np.zeros((n, len(vocabulary)), dtype=np.float32)
+        for row, words in enumerate(tokens):
+            for word in words:
+                tf[row, vocabulary[word]] += 1.0
+
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+        tfidf = tf * idf
+        norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+        tfidf /= np.where(norms == 0, 1.0, norms)
+
+        similarity = tfidf @ tfidf.T
+        np.fill_diagonal(similarity, 0.0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        transition = np.divide(similarity, out_weight, out=np.full_like(similarity, 1.0 / n), where=out_weight > 0)
+
+        scores = np.full(n, 1.0 / n, dtype=np.float32)
+        for _ in range(self.iterations):
+            updated = (1 - self.damping) / n + self.damping * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < 1e-6:
+                scores = updated
+                break
+            scores = updated
+        return scores
+
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        text = re.sub(r'\s+', ' ', text or '').strip()
+        return [s.strip() for s in _SENTENCE_SPLIT.split(text) if len(s.strip()) > 1]
+
+    @staticmethod
+    def _make_title(sentence: str, max_words: int = 12) -> str:
+        words = sentence.rstrip('.!?').split()
+        if len(words) <= max_words:
+            return " ".join(words)
+        return " ".join(words[:max_words]) + "..."
+
+    @staticmethod
+    def _categorize(words: List[str]) -> str:
+        counts = {}
+        for word in words:
+            counts[word] = counts.get(word, 0) + 1
+
+        best, best_score = "Uncategorized", 0
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            score = sum(counts.get(keyword, 0) for keyword in keywords)
+            if score > best_score:
+                best, best_score = category, score
+        return best
+
+# Create global summarizer instance
+extractive_summarizer = ExtractiveSummarizer(max_sentences=settings.extractive_max_sentences)
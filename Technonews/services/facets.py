@@ -0,0 +1,65 @@
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.logging import get_logger
+from models.article import ArticleFacet
+
+logger = get_logger(__name__)
+
+class FacetCache:
+    """
+    In-memory copy of the article_facets counts.
+
+    Facet reads cost one scan of article_facets (one row per category and
+    per source) when the cache is cold and nothing afterwards. Writers in this
+    process call `invalidate()` once their transaction has committed; the
+    TTL bounds staleness after writes from other processes (manage.py).
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._facets: Optional[Dict[str, List[Dict]]] = None
+        self._loaded_at = 0.0
+        # Bumped by invalidate(), so a read racing a write is not cached
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        """Drop the cached counts after articles were stored or deleted."""
+        self._generation += 1
+        self._facets = None
+
+    async def get(self, db: AsyncSession) -> Dict[str, List[Dict]]:
+        """
+        Article counts per category and per source, largest first.
+
+        Args:
+            db: Database session, used only on a cache miss
+
+        Returns:
+            {"category": [{"value", "count"}, ...], "source": [...]}
+        """
+        if self._facets is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return self._facets
+
+        generation = self._generation
+        rows = await db.execute(
+            select(ArticleFacet.dimension, ArticleFacet.value, ArticleFacet.count)
+            .where(ArticleFacet.count > 0)
+            .order_by(ArticleFacet.dimension, desc(ArticleFacet.count), ArticleFacet.value)
+        )
+        facets: Dict[str, List[Dict]] = {"category": [], "source": []}
+        for dimension, value, count in rows:
+            facets.setdefault(dimension, []).append({"value": value, "count": count})
+
+        if generation == self._generation:
+            self._facets = facets
+            self._loaded_at = time.monotonic()
+        logger.debug(f"Loaded {sum(len(values) for values in facets.values())} article facets")
+        return facets
+
+# Create global cache instance
+facet_cache = FacetCache(ttl=settings.facets_cache_ttl)
@@ -0,0 +1,148 @@
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from core.config import settings
+from core.logging import get_logger
+from models.article import Article
+from models.database import SessionLocal
+from services.article_store import article_store
+from services.deepseek import deepseek_service
+from services.facets import facet_cache
+from services.news_fetcher import news_fetcher
+from services.preprocess import normalize_url
+from services.rate_limiter import PRIORITY_BACKGROUND
+
+logger = get_logger(__name__)
+
+# Keep IN (...) lists under SQLite's bound-parameter limit
+_LOOKUP_CHUNK_SIZE = 500
+
+class FeedIngestor:
+    """
+    Background pipeline that summarizes newly seen feed entries and stores them
+    as Article rows, so GET /articles is populated without user-facing LLM calls.
+
+    Entries are deduplicated on the normalized entry link against the
+    articles table and processed in small batches at background priority,
+    leaving LLM capacity for interactive /summarize calls.
+    """
+
+    def __init__(self):
+        self.enabled = settings.auto_summarize_enabled
+        self.interval = settings.auto_summarize_interval
+        self.batch_size = settings.auto_summarize_batch_size
+        self.max_per_cycle = settings.auto_summarize_max_per_cycle
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the periodic ingestion thread if auto-summarization is enabled."""
+        if not self.enabled or self._thread is not None:
+            return
+        if not settings.deepseek_api_key:
+            logger.warning("Auto-summarization enabled but DEEPSEEK_API_KEY is not set; not starting")
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="feed-ingestor", daemon=True)
+        self._thread.start()
+        logger.info(f"Feed auto-summarization started (every {self.interval}s)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the ingestion thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Feed ingestion cycle failed: {str(e)}")
+            self._stop.wait(self.interval)
+
+    def run_once(self) -> int:
+        """
+        Run one ingestion cycle.
+
+        Returns:
+            Number of articles stored
+        """
+        entries = self._new_entries(news_fetcher.fetch_all_entries())
+        logger.info(f"Feed ingestion found {len(entries)} new entries")
+
+        stored = 0
+        for start in range(0, len(entries), self.batch_size):
+            if self._stop.is_set():
+                break
+            stored += self._process_batch(entries[start:start + self.batch_size])
+
+        logger.info(f"Feed ingestion stored {stored} articles")
+        return stored
+
+    def _new_entries(self, entries: List[Dict]) -> List[Dict]:
+        """Drop entries without a link, duplicates, and links already stored."""
+        by_key = {}
+        for entry in entries:
+            link = entry.get('link')
+            if link:
+                by_key.setdefault(normalize_url(link), entry)
+
+        keys = list(by_key)
+        with SessionLocal() as db:
+            for start in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                chunk = keys[start:start + _LOOKUP_CHUNK_SIZE]
+                existing = db.execute(select(Article.url_key).where(Article.url_key.in_(chunk))).scalars()
+                for key in existing:
+                    by_key.pop(key, None)
+
+        new_entries = sorted(by_key.values(), key=self._published_at, reverse=True)
+        return new_entries[:self.max_per_cycle]
+
+    def _process_batch(self, entries: List[Dict]) -> int:
+        """Summarize a batch of entries with packed LLM calls and store the results in one transaction."""
+        texts = [f"{entry.get('title', '')}\n\n{entry.get('summary', '')}".strip() for entry in entries]
+        results = deepseek_service.analyze_batch(texts, priority=PRIORITY_BACKGROUND)
+
+        articles = []
+        for entry, result in zip(entries, results):
+            if result is None:
+                logger.warning(f"Skipping entry {entry['link']}: summarization failed")
+                continue
+
+            articles.append({
+                "title": result["title"] or entry.get('title', 'No Title'),
+                "summary": result["summary"],
+                "category": result["category"],
+                "source_url": entry['link'],
+                "timestamp": self._published_at(entry)
+            })
+
+        if not articles:
+            return 0
+
+        with SessionLocal() as db:
+            try:
+                article_store.upsert_many(db, articles)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to store ingested articles: {str(e)}")
+                return 0
+        facet_cache.invalidate()
+        return len(articles)
+
+    @staticmethod
+    def _published_at(entry: Dict) -> datetime:
+        parsed = entry.get('published_parsed')
+        if parsed:
+            return datetime(*parsed[:6])
+        return datetime.utcnow()
+
+# Create global ingestor instance
+feed_ingestor = FeedIngestor()
@@ -0,0 +1,230 @@
+import json
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.logging import get_logger
+from models.database import SessionLocal
+from models.job import SummarizationJob, JOB_PENDING, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED
+from services.deepseek import deepseek_service
+from services.rate_limiter import PRIORITY_BACKGROUND
+from services.resilience import RETRYABLE_STATUS_CODES
+
+logger = get_logger(__name__)
+
+class SummarizationJobQueue:
+    """
+    Durable summarization job queue backed by the application database.
+
+    Jobs are rows in `summarization_jobs`. A pool of worker threads claims
+    pending rows with a conditional UPDATE, so several workers (or processes)
+    never run the same job twice. Running jobs hold a lease; if a worker dies
+    the lease expires and the job is put back in the queue. Each claim bumps
+    `attempts`, and a worker only records its outcome while the row still
+    carries its claim, so a job requeued from under a slow worker is not
+    overwritten by it. Jobs failing with a retryable upstream error are not
+    claimable again until `available_at`, set from the upstream Retry-After
+    or an exponential backoff.
+    """
+
+    def __init__(self):
+        self.worker_count = settings.summarize_workers
+        self.poll_interval = settings.summarize_job_poll_interval
+        self.lease_seconds = settings.summarize_job_lease_seconds
+        self.max_attempts = settings.summarize_job_max_attempts
+        self.retry_base_delay = settings.summarize_job_retry_base_delay
+        self.retry_max_delay = settings.summarize_job_retry_max_delay
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def enqueue(self, db: Session, article_text: str) -> SummarizationJob:
+        """
+        Create a pending job.
+
+        Args:
+            db: Database session
+            article_text: Article content to summarize
+
+        Returns:
+            The persisted SummarizationJob
+        """
+        now = datetime.utcnow()
+        job = SummarizationJob(
+            id=uuid.uuid4().hex,
+            status=JOB_PENDING,
+            article_text=article_text,
+            attempts=0,
+            created_at=now,
+            updated_at=now
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        logger.info(f"Enqueued summarization job {job.id}")
+        self._wakeup.set()
+        return job
+
+    def get(self, db: Session, job_id: str) -> Optional[SummarizationJob]:
+        """Look up a job by id."""
+        return db.get(SummarizationJob, job_id)
+
+    def start(self) -> None:
+        """Start the worker pool. Jobs whose lease expired while no worker was polling are requeued first."""
+        if self._threads or self.worker_count <= 0:
+            return
+
+        self._stop.clear()
+        # Only expired leases: running jobs may belong to live workers in other processes
+        self.requeue_stuck_jobs()
+
+        for i in range(self.worker_count):
+            thread = threading.Thread(target=self._worker_loop, name=f"summarize-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Started {self.worker_count} summarization workers")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal workers to stop and wait for them to finish their current job."""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("Summarization workers stopped")
+
+    def requeue_stuck_jobs(self) -> int:
+        """
+        Return jobs whose lease has expired to the queue, or fail them once
+        they have used up their attempts.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        now = datetime.utcnow()
+        cutoff = now - timedelta(seconds=self.lease_seconds)
+        stuck = (SummarizationJob.status == JOB_RUNNING, SummarizationJob.started_at < cutoff)
+
+        with SessionLocal() as db:
+            failed = db.execute(
+                update(SummarizationJob)
+                .where(*stuck, SummarizationJob.attempts >= self.max_attempts)
+                .values(status=JOB_FAILED, error="Job lease expired too many times", updated_at=now)
+            ).rowcount
+            requeued = db.execute(
+                update(SummarizationJob)
+                .where(*stuck)
+                .values(status=JOB_PENDING, started_at=None, updated_at=now)
+            ).rowcount
+            db.commit()
+
+        if failed or requeued:
+            logger.warning(f"Requeued {requeued} and failed {failed} stuck summarization jobs")
+            self._wakeup.set()
+        return failed + requeued
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.requeue_stuck_jobs()
+                claimed = self._claim_next()
+            except Exception as e:
+                logger.error(f"Summarization worker failed to poll queue: {str(e)}")
+                claimed = None
+
+            if claimed is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._run(*claimed)
+
+    def _claim_next(self) -> Optional[Tuple[str, str, int]]:
+        """Atomically move the oldest pending job to running. Returns (id, text, attempts)."""
+        with SessionLocal() as db:
+            while True:
+                job_id = db.execute(
+                    select(SummarizationJob.id)
+                    .where(SummarizationJob.status == JOB_PENDING,
+                           or_(SummarizationJob.available_at.is_(None),
+                               SummarizationJob.available_at <= datetime.utcnow()))
+                    .order_by(SummarizationJob.created_at)
+                    .limit(1)
+                ).scalar()
+                if job_id is None:
+                    return None
+
+                now = datetime.utcnow()
+                claimed = db.execute(
+                    update(SummarizationJob)
+                    .where(SummarizationJob.id == job_id, SummarizationJob.status == JOB_PENDING)
+                    .values(
+                        status=JOB_RUNNING,
+                        attempts=SummarizationJob.attempts + 1,
+                        started_at=now,
+                        updated_at=now
+                    )
+                ).rowcount
+                db.commit()
+
+                if claimed:
+                    job = db.get(SummarizationJob, job_id)
+                    return job.id, job.article_text, job.attempts
+                # Another worker won the race; try the next job
+
+    def _run(self, job_id: str, article_text: str, attempts: int) -> None:
+        logger.info(f"Running summarization job {job_id} (attempt {attempts})")
+        try:
+            result = deepseek_service.analyze_article(article_text, priority=PRIORITY_BACKGROUND)
+        except HTTPException as e:
+            retryable = e.status_code in RETRYABLE_STATUS_CODES and attempts < self.max_attempts
+            self._finish(job_id, attempts, error=str(e.detail), retry=retryable,
+                         retry_after=getattr(e, "retry_after", None))
+            return
+        except Exception as e:
+            self._finish(job_id, attempts, error=str(e), retry=False)
+            return
+
+        self._finish(job_id, attempts, result=result)
+
+    def _retry_delay(self, attempts: int, retry_after: Optional[float]) -> float:
+        """Seconds before a failed job may be claimed again."""
+        if retry_after is not None:
+            return retry_after
+        return min(self.retry_max_delay, self.retry_base_delay * (2 ** (attempts - 1)))
+
+    def _finish(self, job_id: str, attempts: int, result: Optional[dict] = None, error: Optional[str] = None,
+                retry: bool = False, retry_after: Optional[float] = None) -> None:
+        if result is not None:
+            values = {"status": JOB_SUCCEEDED, "result": json.dumps(result), "error": None}
+            logger.info(f"Summarization job {job_id} succeeded")
+        elif retry:
+            delay = self._retry_delay(attempts, retry_after)
+            values = {"status": JOB_PENDING, "error": error,
+                      "available_at": datetime.utcnow() + timedelta(seconds=delay)}
+            logger.warning(f"Summarization job {job_id} failed, will retry in {delay:.0f}s: {error}")
+        else:
+            values = {"status": JOB_FAILED, "error": error}
+            logger.error(f"Summarization job {job_id} failed: {error}")
+
+        with SessionLocal() as db:
+            # `attempts` identifies this claim; a later claim of the same job has a higher count
+            finished = db.execute(
+                update(SummarizationJob)
+                .where(SummarizationJob.id == job_id, SummarizationJob.status == JOB_RUNNING,
+                       SummarizationJob.attempts == attempts)
+                .values(started_at=None, updated_at=datetime.utcnow(), **values)
+            ).rowcount
+            db.commit()
+        if not finished:
+            logger.warning(f"Summarization job {job_id} was requeued after its lease expired; discarding attempt {attempts}")
+
+# Create global job queue instance
+summarization_jobs = SummarizationJobQueue()
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+
+from core.config import settings
+
+# Reporting windows for GET /summarize/stats
+WINDOWS = {"1m": 60, "5m": 300, "1h": 3600, "24h": 86400}
+
+class LLMCallRecord(NamedTuple):
+    """One upstream call attempt, kept in compact tuple form."""
+    timestamp: float
+    model: str
+    status: str  # HTTP status code, "timeout" or "error"
+    latency_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int
+
+class LLMUsageStats:
+    """
+    In-memory accounting of LLM calls: a bounded ring buffer of recent call
+    records for windowed percentiles, plus lifetime totals. Windows reaching
+    back past the oldest record of a full buffer are reported as truncated.
+    """
+
+    def __init__(self, capacity: int):
+        self._records = deque(maxlen=max(1, capacity))
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._totals = {"calls": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0,
+                        "cached_tokens": 0, "cost_usd": 0.0}
+
+    def record(self, model: str, status: str, latency_seconds: float, usage: Optional[dict] = None) -> None:
+        """
+        Record one call attempt.
+
+        Args:
+            model: Model name sent to the provider
+            status: HTTP status code as a string, "timeout" or "error"
+            latency_seconds: Wall time of the attempt
+            usage: The provider's `usage` object, if the call succeeded
+        """
+        usage = usage or {}
+        prompt_tokens = int(usage.get("prompt_tokens", 0))
+        completion_tokens = int(usage.get("completion_tokens", 0))
+        cached_tokens = int(usage.get("prompt_cache_hit_tokens", 0))
+        entry = LLMCallRecord(time.time(), model, status, latency_seconds * 1000.0,
+                              prompt_tokens, completion_tokens, cached_tokens)
+
+        with self._lock:
+            self._records.append(entry)
+            self._totals["calls"] += 1
+            self._totals["errors"] += status != "200"
+            self._totals["prompt_tokens"] += prompt_tokens
+            self._totals["completion_tokens"] += completion_tokens
+            self._totals["cached_tokens"] += cached_tokens
+            self._totals["cost_usd"] += self.cost(entry)
+
+    @staticmethod
+    def cost(entry: LLMCallRecord) -> float:
+        """Estimated USD cost of a call from the configured per-million-token prices."""
+        uncached = entry.prompt_tokens - entry.cached_tokens
+        return (
+            uncached * settings.llm_price_input_per_mtok
+            + entry.cached_tokens * settings.llm_price_cached_input_per_mtok
+            + entry.completion_tokens * settings.llm_price_output_per_mtok
+        ) / 1_000_000
+
+    def window(self, seconds: int) -> Dict:
+        """Aggregate the calls recorded in the last `seconds` seconds."""
+        cutoff = time.time() - seconds
+        with self._lock:
+            entries = [e for e in self._records if e.timestamp >= cutoff]
+            truncated = len(self._records) == self._records.maxlen and self._records[0].timestamp > cutoff
+
+        latencies = sorted(e.latency_ms for e in entries)
+        ok = [e for e in entries if e.status == "200"]
+        return {
+            "calls": len(entries),
+            "errors": len(entries) - len(ok),
+            "cache_hits": sum(1 for e in ok if e.cached_tokens > 0),
+            "prompt_tokens": sum(e.prompt_tokens for e in ok),
+            "completion_tokens": sum(e.completion_tokens for e in ok),
+            "cost_usd": round(sum(self.cost(e) for e in ok), 6),
+            "latency_ms_p50": self._percentile(latencies, 50),
+            "latency_ms_p95": self._percentile(latencies, 95),
+            "latency_ms_p99": self._percentile(latencies, 99),
+            "by_status": self._count_by(entries, "status"),
+            "by_model": self._count_by(entries, "model"),
+            "truncated": truncated,
+        }
+
+    def totals(self) -> Dict:
+        """Lifetime totals since process start."""
+        with self._lock:
+            totals = dict(self._totals)
+        totals["cost_usd"] = round(totals["cost_usd"], 6)
+        totals["since"] = self._started_at
+        return totals
+
+    @staticmethod
+    def _percentile(ordered: List[float], p: float) -> Optional[float]:
+        if not ordered:
+            return None
+        index = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+        return round(ordered[index], 1)
+
+    @staticmethod
+    def _count_by(entries: List[LLMCallRecord], field: str) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for entry in entries:
+            key = getattr(entry, field)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+def default_capacity() -> int:
+    """Records needed to cover the longest window at the scheduler's request limit (every attempt is admitted by it)."""
+    return settings.llm_requests_per_minute * (max(WINDOWS.values()) // 60 + 1)
+
+# Create global stats instance
+llm_usage_stats = LLMUsageStats(capacity=settings.llm_stats_capacity or default_capacity())
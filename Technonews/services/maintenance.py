@@ -0,0 +1,63 @@
+import os
+from typing import Dict
+
+from sqlalchemy.engine import Engine
+
+from core.logging import get_logger
+from models.migrations import DEDUPLICATE_ARTICLES, RECOMPUTE_ARTICLE_RATINGS, run_script
+
+logger = get_logger(__name__)
+
+def _database_size(engine: Engine) -> int:
+    path = engine.url.database
+    if not path or path == ":memory:":
+        return 0
+    return sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix))
+
+def compact_articles(engine: Engine) -> Dict[str, int]:
+    """
+    Deduplicate the articles table and reclaim the space it frees.
+
+    Recomputes every url_key with the current normalization rules, collapses
+    articles that now share a key (moving their feedback to the kept row and
+    recomputing its rating counters), then VACUUMs and re-analyzes the database so the table and its indexes
+    shrink on disk.
+
+    Args:
+        engine: Engine for the SQLite database to compact
+
+    Returns:
+        Row counts and database size in bytes before and after
+    """
+    if engine.dialect.name != "sqlite":
+        raise NotImplementedError("Article compaction is only implemented for SQLite")
+
+    with engine.connect() as conn:
+        rows_before = conn.exec_driver_sql("SELECT COUNT(*) FROM articles").scalar()
+        conn.rollback()
+        size_before = _database_size(engine)
+        logger.info(f"Compacting {rows_before} articles ({size_before} bytes)")
+        run_script(conn, [
+            "DROP INDEX IF EXISTS ux_articles_url_key",
+            "UPDATE articles SET url_key = normalize_url(source_url)",
+            *DEDUPLICATE_ARTICLES,
+            # Duplicates' counters were cascade-deleted and their feedback moved to the kept rows
+            RECOMPUTE_ARTICLE_RATINGS,
+            "CREATE UNIQUE INDEX ux_articles_url_key ON articles (url_key)",
+        ])
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+        conn.exec_driver_sql("ANALYZE")
+        # VACUUM goes through the WAL in WAL mode; fold it back into the main file
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        rows_after = conn.exec_driver_sql("SELECT COUNT(*) FROM articles").scalar()
+
+    stats = {
+        "rows_before": rows_before,
+        "rows_after": rows_after,
+        "bytes_before": size_before,
+        "bytes_after": _database_size(engine),
+    }
+    logger.info(f"Article compaction finished: {stats}")
+    return stats
@@ -29,6 +29,27 @@ class NewsFetcher:
         """
         logger.info(f"Fetching news for theme: {theme}")
         
+        all_articles = self.fetch_all_entries()
+        if not all_articles:
+            return []
+        
+        # Filter articles by theme
+        filtered_articles = self._filter_by_theme(all_articles, theme)
+        
+        # Sort by publication date (newest first) and limit results
+        filtered_articles.sort(key=lambda x: x.get('published_parsed', datetime.min), reverse=True)
+        result = filtered_articles[:limit]
+        
+        logger.info(f"Found {len(result)} articles for theme '{theme}'")
+        return result
+    
+    def fetch_all_entries(self) -> List[Dict]:
+        """
+        Fetch every entry from all configured RSS feeds, unfiltered.
+        
+        Returns:
+            List of parsed articles from all feeds; feeds that fail are skipped
+        """
         # Get configured RSS feeds
         feeds_config = self.feeds_service.read_feeds()
         rss_feeds = feeds_config.get("feeds", [])
@@ -49,15 +70,7 @@ class NewsFetcher:
                 logger.error(f"Error fetching from {feed_url}: {str(e)}")
                 continue
         
-        # Filter articles by theme
-        filtered_articles = self._filter_by_theme(all_articles, theme)
-        
-        # Sort by publication date (newest first) and limit results
-        filtered_articles.sort(key=lambda x: x.get('published_parsed', datetime.min), reverse=True)
-        result = filtered_articles[:limit]
-        
-        logger.info(f"Found {len(result)} articles for theme '{theme}'")
-        return result
+        return all_articles
     
     def _parse_rss_feed(self, feed_url: str) -> List[Dict]:
         """Parse a single RSS feed and extract articles."""
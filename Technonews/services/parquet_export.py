@@ -0,0 +1,132 @@
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.engine import Connection, Engine
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Watermark file kept next to the exported tables
+WATERMARK_FILE = "_watermark.json"
+
+# Exported tables: (column, Arrow type name) in file column order
+PARQUET_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "articles": [("id", "int64"), ("title", "string"), ("summary", "string"), ("category", "string"),
+                 ("source_url", "string"), ("url_key", "string"), ("source", "string"), ("timestamp", "timestamp")],
+    "feedback": [("id", "int64"), ("article_id", "int64"), ("feedback", "string"), ("timestamp", "timestamp")],
+}
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+    return pyarrow, pyarrow.parquet
+
+def read_watermark(out_dir: str) -> Dict[str, int]:
+    """Last exported id per table (0 for tables never exported)."""
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {table: 0 for table in PARQUET_TABLES}
+    with open(path, "r", encoding="utf-8") as f:
+        stored = json.load(f)
+    return {table: int(stored.get(table, 0)) for table in PARQUET_TABLES}
+
+def _write_watermark(out_dir: str, watermark: Dict[str, int]) -> None:
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({**watermark, "updated_at": datetime.utcnow().isoformat()}, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+def _export_table(conn: Connection, pa, pq, table: str, table_dir: str, after_id: int,
+                  batch_size: int, compression: str) -> Tuple[int, int, Optional[str]]:
+    """
+    Write rows with after_id < id <= MAX(id) to one new Parquet file, one row
+    group per batch. Returns (rows written, new watermark, file name or None).
+    """
+    columns = PARQUET_TABLES[table]
+    # Timestamps are read as SQLite's stored text and parsed by Arrow in bulk
+    schema = pa.schema([(name, pa.timestamp("us") if kind == "timestamp" else getattr(pa, kind)())
+                        for name, kind in columns])
+    upper = conn.exec_driver_sql(f"SELECT MAX(id) FROM {table}").scalar() or 0
+    if upper <= after_id:
+        return 0, after_id, None
+
+    select = (f"SELECT {', '.join(name for name, _ in columns)} FROM {table} "
+              f"WHERE id > ? AND id <= ? ORDER BY id LIMIT ?")
+    name = f"part-{after_id + 1:012d}-{upper:012d}.parquet"
+    # Dot-prefixed while being written, so dataset readers skip it
+    partial = os.path.join(table_dir, f".{name}.tmp")
+    written = 0
+    last_id = after_id
+    with pq.ParquetWriter(partial, schema, compression=compression) as writer:
+        while True:
+            # Keyset pages keep each read short and memory bounded by batch_size
+            rows = conn.exec_driver_sql(select, (last_id, upper, batch_size)).fetchall()
+            if not rows:
+                break
+            arrays = [
+                pa.array(values, pa.string()).cast(field.type) if kind == "timestamp" else pa.array(values, field.type)
+                for (_, kind), field, values in zip(columns, schema, zip(*rows))
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            written += len(rows)
+            last_id = rows[-1][0]
+            conn.rollback()
+    os.replace(partial, os.path.join(table_dir, name))
+    return written, upper, name
+
+def export_parquet(engine: Engine, out_dir: str, batch_size: int = 50_000, full: bool = False,
+                   compression: str = "zstd") -> Dict[str, Dict]:
+    """
+    Export articles and feedback to Parquet datasets under `out_dir`.
+
+    Each table gets a directory (`out_dir/articles`, `out_dir/feedback`) that
+    pandas or pyarrow read as one dataset. A run appends one file per table
+    holding the rows added since the previous run, tracked by id in
+    `out_dir/_watermark.json`; the watermark only advances once a file is
+    complete. Articles updated in place by a re-store keep their id and are
+    not re-exported incrementally; use `full` to rewrite both tables.
+
+    Args:
+        engine: Engine for the SQLite database to export
+        out_dir: Output directory (created if missing)
+        batch_size: Rows per read and per Parquet row group
+        full: Ignore the watermark and replace previously exported files
+        compression: Parquet compression codec
+
+    Returns:
+        Per-table rows written, watermark and seconds taken
+    """
+    if engine.dialect.name != "sqlite":
+        raise NotImplementedError("Parquet export is only implemented for SQLite")
+    pa, pq = _import_pyarrow()
+
+    os.makedirs(out_dir, exist_ok=True)
+    watermark = {table: 0 for table in PARQUET_TABLES} if full else read_watermark(out_dir)
+    report = {}
+    with engine.connect() as conn:
+        for table in PARQUET_TABLES:
+            table_dir = os.path.join(out_dir, table)
+            os.makedirs(table_dir, exist_ok=True)
+            # A full export replaces earlier files, but only once its own file is complete
+            stale = [name for name in os.listdir(table_dir)
+                     if name.startswith("part-") and name.endswith(".parquet")] if full else []
+
+            started = time.perf_counter()
+            written, watermark[table], name = _export_table(
+                conn, pa, pq, table, table_dir, watermark[table], max(1, batch_size), compression
+            )
+            for stale_name in stale:
+                if stale_name != name:
+                    os.remove(os.path.join(table_dir, stale_name))
+            _write_watermark(out_dir, watermark)
+            report[table] = {"rows": written, "watermark": watermark[table],
+                             "seconds": round(time.perf_counter() - started, 2)}
+            logger.info(f"Exported {written} {table} rows to {table_dir} (watermark {watermark[table]})")
+    return report
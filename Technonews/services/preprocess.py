@@ -0,0 +1,111 @@
+import html
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+_DROP_BLOCKS = re.compile(r'<(script|style|noscript|iframe|svg|figure)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_COMMENTS = re.compile(r'<!--.*?-->', re.DOTALL)
+_BLOCK_BREAKS = re.compile(r'<\s*(br|/p|/div|/li|/h[1-6]|/tr|/blockquote)\b[^>]*>', re.IGNORECASE)
+_TAGS = re.compile(r'<[^>]+>')
+_URLS = re.compile(r'https?://[^\s<>"\')\]]+')
+_INVISIBLE = re.compile(r'[​‌‍⁠﻿]')
+_HORIZONTAL_SPACE = re.compile(r'[ \t\f\v\xa0]+')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "igshid", "ref_src", "cmpid")
+
+# Lines that carry no article content (feed footers, share/subscribe prompts, credits)
+BOILERPLATE_LINES = re.compile(
+    r'^(?:'
+    r'the post .+ appeared first on .+'
+    r'|(?:continue|keep) reading.*'
+    r'|read (?:more|the full (?:story|article)).*'
+    r'|(?:click|tap) here.*'
+    r'|(?:sign up|subscribe)\b.*(?:newsletter|updates|inbox).*'
+    r'|share (?:this|on) .*'
+    r'|follow us on .*'
+    r'|advertisement'
+    r'|(?:image|photo|photograph|credit)s?:.*'
+    r'|\[?(?:…|\.\.\.)\]?'
+    r')$',
+    re.IGNORECASE
+)
+
+def strip_tracking_params(url: str) -> str:
+    """Remove analytics query parameters (utm_*, fbclid, ...) from a URL."""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL, used as its deduplication key.
+
+    Lowercases the host, treats http/https and a leading "www." as equivalent,
+    drops default ports, fragments, tracking parameters and trailing slashes,
+    and sorts the remaining query parameters. Malformed URLs (bad port or
+    IPv6 host) are returned stripped but otherwise unchanged.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        if not parts.netloc:
+            return url.strip()
+        host = (parts.hostname or "").lower()
+        port = parts.port
+    except ValueError:
+        return url.strip()
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(TRACKING_PARAMS))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+def url_host(url: str) -> str:
+    """Publisher host of a URL as used for per-source grouping, e.g. "techcrunch.com"."""
+    try:
+        return urlsplit(normalize_url(url)).hostname or ""
+    except ValueError:
+        return ""
+
+def clean_article_text(text: str) -> str:
+    """
+    Reduce raw article or feed content to the plain text worth sending to the LLM.
+
+    Strips HTML markup (dropping script/style/figure blocks entirely), decodes
+    entities, removes tracking parameters from URLs, drops boilerplate lines
+    such as "The post ... appeared first on ..." and normalizes whitespace.
+
+    Args:
+        text: Raw article text, possibly HTML
+
+    Returns:
+        Cleaned plain text
+    """
+    if not text:
+        return ""
+
+    if '<' in text:
+        text = _COMMENTS.sub(' ', text)
+        text = _DROP_BLOCKS.sub(' ', text)
+        text = _BLOCK_BREAKS.sub('\n', text)
+        text = _TAGS.sub(' ', text)
+    text = html.unescape(text)
+    text = _INVISIBLE.sub('', text)
+    text = _URLS.sub(lambda m: strip_tracking_params(m.group(0)), text)
+
+    lines = []
+    for line in text.splitlines():
+        line = _HORIZONTAL_SPACE.sub(' ', line).strip()
+        if line and BOILERPLATE_LINES.match(line):
+            continue
+        lines.append(line)
+
+    return _BLANK_LINES.sub('\n\n', '\n'.join(lines)).strip()
@@ -0,0 +1,136 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Optional
+
+from core.config import settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Lower value = served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+PRIORITY_BATCH = 20
+
+class TokenBucket:
+    """
+    Classic token bucket. Not thread-safe on its own; LLMScheduler guards it.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self.updated_at = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Give back (positive) or take (negative) tokens after the real cost is known."""
+        self.tokens = min(self.capacity, self.tokens + delta)
+
+class RateLimitTimeout(Exception):
+    """Raised when a caller could not be admitted before its timeout."""
+
+class LLMScheduler:
+    """
+    Client-side admission control for outbound LLM calls.
+
+    Every call must acquire one request token and its estimated prompt+completion
+    tokens. Waiting callers are served strictly by priority (then FIFO), so
+    interactive requests overtake queued background and batch work.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._cond = threading.Condition()
+        self._request_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self._token_bucket = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._paused_until = 0.0
+
+    def acquire(self, tokens: int, priority: int = PRIORITY_INTERACTIVE, timeout: Optional[float] = None) -> None:
+        """
+        Block until the call may be sent.
+
+        Args:
+            tokens: Estimated total tokens for the call
+            priority: One of the PRIORITY_* constants
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Raises:
+            RateLimitTimeout: If the call could not be admitted in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        ticket = (priority, next(self._sequence))
+
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = None
+                    if self._waiters[0] == ticket:
+                        wait = max(
+                            self._paused_until - now,
+                            self._request_bucket.time_until(1, now),
+                            self._token_bucket.time_until(tokens, now),
+                        )
+                        if wait <= 0:
+                            self._request_bucket.consume(1, now)
+                            self._token_bucket.consume(tokens, now)
+                            return
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            raise RateLimitTimeout("Timed out waiting for LLM rate limit capacity")
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    self._cond.wait(wait)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the provider reports real usage."""
+        with self._cond:
+            self._token_bucket.adjust(estimated_tokens - actual_tokens)
+            self._cond.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """Stop admitting calls for `seconds`, e.g. after a 429 with Retry-After."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            logger.warning(f"LLM scheduler paused for {seconds:.1f}s")
+            self._cond.notify_all()
+
+    @property
+    def queue_depth(self) -> int:
+        with self._cond:
+            return len(self._waiters)
+
+# Create global scheduler instance
+llm_scheduler = LLMScheduler(
+    requests_per_minute=settings.llm_requests_per_minute,
+    tokens_per_minute=settings.llm_tokens_per_minute
+)
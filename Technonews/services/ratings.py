@@ -0,0 +1,81 @@
+import math
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from core.logging import get_logger
+from models.article import ArticleRating, Feedback
+from models.database import upsert_insert
+from services.analytics import feedback_rollups
+
+logger = get_logger(__name__)
+
+# z for a 95% confidence interval
+WILSON_Z = 1.96
+
+def wilson_lower_bound(likes: int, dislikes: int, z: float = WILSON_Z) -> float:
+    """
+    Lower bound of the Wilson score interval for the share of likes.
+
+    Ranks 40 likes / 2 dislikes above 2 likes / 0 dislikes, which a plain
+    ratio would not; articles without votes score 0.
+    """
+    n = likes + dislikes
+    if n == 0:
+        return 0.0
+    p = likes / n
+    z2 = z * z
+    return (p + z2 / (2 * n) - z * math.sqrt((p * (1 - p) + z2 / (4 * n)) / n)) / (1 + z2 / n)
+
+class RatingService:
+    """
+    Records votes and keeps the article_ratings counters (and the analytics
+    rollups) in step, so reading an article's likes, dislikes and score is a
+    primary-key lookup instead of an aggregate over the feedback table.
+    """
+
+    def record_vote(self, db: Session, article_id: int, feedback: str) -> Tuple[int, int]:
+        """
+        Append a Feedback row and increment the article's counters and rollups.
+
+        Runs on the caller's transaction; the caller commits.
+
+        Args:
+            db: Database session
+            article_id: Article being rated
+            feedback: 'like' or 'dislike'
+
+        Returns:
+            The article's (likes, dislikes) after this vote
+        """
+        like, dislike = (1, 0) if feedback == "like" else (0, 1)
+        now = datetime.utcnow()
+        db.add(Feedback(article_id=article_id, feedback=feedback, timestamp=now))
+        feedback_rollups.record(db, article_id, like, dislike, now)
+
+        statement = upsert_insert(db.get_bind().dialect.name, ArticleRating).values(
+            article_id=article_id, likes=like, dislikes=dislike,
+            score=wilson_lower_bound(like, dislike), updated_at=now
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ArticleRating.article_id],
+            set_={
+                "likes": ArticleRating.likes + like,
+                "dislikes": ArticleRating.dislikes + dislike,
+                "updated_at": now,
+            }
+        ).returning(ArticleRating.likes, ArticleRating.dislikes)
+        likes, dislikes = db.execute(statement).one()
+
+        # The score needs sqrt, which SQLite builds may lack, so set it from Python
+        db.execute(
+            update(ArticleRating)
+            .where(ArticleRating.article_id == article_id)
+            .values(score=wilson_lower_bound(likes, dislikes))
+        )
+        return likes, dislikes
+
+# Create global rating service instance
+rating_service = RatingService()
@@ -0,0 +1,73 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from fastapi import HTTPException
+
+# Upstream statuses worth another attempt
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class UpstreamError(HTTPException):
+    """
+    HTTPException raised for a failed upstream call, carrying what the retry
+    layer needs: whether another attempt may succeed and how long to wait.
+    """
+
+    def __init__(self, status_code: int, detail: str, retryable: bool = False,
+                 retry_after: Optional[float] = None, headers: Optional[dict] = None):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+class Deadline:
+    """Absolute point in time by which a request must be answered."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def cap(self, seconds: float) -> float:
+        """Clamp a timeout so it does not outlive the deadline."""
+        return min(seconds, self.remaining())
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+class LatencyTracker:
+    """Rolling window of recent call latencies used to pick the hedging delay."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Latency at percentile `p` (0-100), or None until enough samples are seen."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
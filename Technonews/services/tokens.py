@@ -0,0 +1,73 @@
+import re
+from typing import List
+
+# Rough average for English text with BPE tokenizers (DeepSeek, GPT family)
+CHARS_PER_TOKEN = 4
+
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Uses a character-based heuristic so it is cheap enough to run on every
+    request without pulling in a tokenizer dependency.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+    Split text into chunks that each fit within a token budget.
+
+    Paragraph boundaries are preferred, then sentence boundaries; anything
+    still too large is cut at a fixed character width.
+
+    Args:
+        text: Text to split
+        max_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        List of non-empty chunks in original order
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+
+    pieces = []
+    for paragraph in _PARAGRAPH_SPLIT.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_SPLIT.split(paragraph):
+            if len(sentence) <= max_chars:
+                pieces.append(sentence)
+            else:
+                pieces.extend(sentence[i:i + max_chars] for i in range(0, len(sentence), max_chars))
+
+    # Greedily pack pieces back together up to the budget
+    chunks = []
+    current = []
+    current_len = 0
+    for piece in pieces:
+        extra = len(piece) + (2 if current else 0)
+        if current and current_len + extra > max_chars:
+            chunks.append("\n\n".join(current))
+            current = []
+            current_len = 0
+            extra = len(piece)
+        current.append(piece)
+        current_len += extra
+    if current:
+        chunks.append("\n\n".join(current))
+
+    return chunks
@@ -0,0 +1,200 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from core.config import settings
+from core.logging import get_logger
+from models.database import WriterSessionLocal
+
+logger = get_logger(__name__)
+
+# A write operation runs on the writer's session and returns its result
+WriteOperation = Callable[..., Any]
+
+class WriteQueueFull(HTTPException):
+    """The write queue stayed full for longer than WRITE_QUEUE_TIMEOUT."""
+
+    def __init__(self):
+        super().__init__(status_code=503, detail="Write queue is full, try again shortly.")
+
+class GroupCommitWriter:
+    """
+    Single writer task that commits queued database writes in groups.
+
+    Routes submit sync operations `(session, *args) -> result` to a bounded
+    queue. The writer takes up to `max_batch` of them (waiting at most
+    `max_delay` for a group to fill), runs each inside its own SAVEPOINT on
+    one connection and commits the group with a single COMMIT, so N
+    concurrent writes cost one fsync instead of N and never contend for
+    SQLite's write lock. Each caller's future resolves only after its group
+    has committed, so acknowledged writes are as durable as before; an
+    operation that fails rolls back only its savepoint.
+    """
+
+    def __init__(self, max_batch: int, max_delay_ms: float, max_queue: int, enqueue_timeout: float):
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay_ms / 1000.0
+        self.max_queue = max_queue
+        self.enqueue_timeout = enqueue_timeout
+        # All database work happens on this one thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="group-commit")
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.groups_committed = 0
+        self.writes_committed = 0
+
+    async def start(self) -> None:
+        """Start the writer task on the running event loop if the write queue is enabled."""
+        if not settings.write_queue_enabled or self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run(), name="group-commit-writer")
+        logger.info(f"Group-commit writer started (max batch {self.max_batch}, max delay {self.max_delay * 1000:g}ms)")
+
+    async def stop(self) -> None:
+        """
+        Commit everything already queued, then stop the writer task.
+
+        If the stop marker cannot be queued within WRITE_QUEUE_TIMEOUT (the
+        queue is full and the writer has died or stalled) the task is
+        cancelled instead. Writes left in the queue fail rather than leaving
+        their callers waiting.
+        """
+        if self._task is None:
+            return
+        if not self._task.done():
+            try:
+                await asyncio.wait_for(self._queue.put(None), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                logger.error("Group-commit writer is not draining its queue, cancelling it")
+                self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Group-commit writer failed: {str(e)}")
+        self._fail_queued(self._queue)
+        self._task = None
+        self._queue = None
+        logger.info(f"Group-commit writer stopped ({self.writes_committed} writes in {self.groups_committed} groups)")
+
+    async def submit(self, operation: WriteOperation, *args) -> Any:
+        """
+        Queue a write and wait until it has been committed.
+
+        Without a running writer (disabled, or outside the app lifespan) the
+        operation is committed on its own.
+
+        Args:
+            operation: Callable taking the writer's Session followed by `args`
+            *args: Arguments for the operation
+
+        Returns:
+            The operation's return value
+
+        Raises:
+            WriteQueueFull: If the queue stays full for WRITE_QUEUE_TIMEOUT seconds
+            Exception: Whatever the operation or the commit raised
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None:
+            [(ok, value)] = await loop.run_in_executor(self._executor, self._commit_group, [(operation, args)])
+        else:
+            future = loop.create_future()
+            queue = self._queue
+            try:
+                await asyncio.wait_for(queue.put((operation, args, future)), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                raise WriteQueueFull()
+            if queue is not self._queue and not future.done():
+                # Queued after stop() drained the queue; nothing will run it
+                raise RuntimeError("Group-commit writer stopped before the write was committed")
+            ok, value = await future
+        if not ok:
+            raise value
+        return value
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            group = [item]
+            deadline = loop.time() + self.max_delay
+            while len(group) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                group.append(item)
+
+            try:
+                outcomes = await loop.run_in_executor(
+                    self._executor, self._commit_group, [(operation, args) for operation, args, _ in group]
+                )
+            except BaseException as e:
+                # Cancelled by stop() or crashed: the group's outcome is unknown, so fail its callers
+                error = RuntimeError(f"Group-commit writer stopped before confirming the write: {e!r}")
+                for _, _, future in group:
+                    if not future.done():
+                        future.set_result((False, error))
+                raise
+            for (_, _, future), outcome in zip(group, outcomes):
+                if not future.done():
+                    future.set_result(outcome)
+
+    @staticmethod
+    def _fail_queued(queue: asyncio.Queue) -> None:
+        """Fail the futures of writes still queued after the writer stopped."""
+        error = RuntimeError("Group-commit writer stopped before the write was committed")
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if item is not None and not item[2].done():
+                item[2].set_result((False, error))
+
+    def _commit_group(self, group: List[Tuple[WriteOperation, tuple]]) -> List[Tuple[bool, Any]]:
+        """Run each operation in a savepoint and commit once; returns (ok, result or exception) per operation."""
+        outcomes: List[Tuple[bool, Any]] = []
+        with WriterSessionLocal() as db:
+            for operation, args in group:
+                try:
+                    with db.begin_nested():
+                        outcomes.append((True, operation(db, *args)))
+                except Exception as e:
+                    outcomes.append((False, e))
+            try:
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Group commit of {len(group)} writes failed: {str(e)}")
+                return [(False, e)] * len(group)
+
+        self.groups_committed += 1
+        self.writes_committed += sum(1 for ok, _ in outcomes if ok)
+        logger.debug(f"Committed write group of {len(group)}")
+        return outcomes
+
+# Create global writer instance
+group_writer = GroupCommitWriter(
+    max_batch=settings.write_batch_max_items,
+    max_delay_ms=settings.write_batch_max_delay_ms,
+    max_queue=settings.write_queue_max_size,
+    enqueue_timeout=settings.write_queue_timeout
+)